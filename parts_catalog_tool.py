@@ -102,25 +102,35 @@ Revision History (Code)
 import sys
 import shutil
 import os
+import stat
 import datetime
+import time
 import json
 import re
 import tempfile
+import zipfile
+import random
+import hashlib
+import mmap
 import subprocess
 import platform
 from typing import Optional
 import shlex
 import threading, queue
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from collections import OrderedDict, deque
+from functools import lru_cache
+from bisect import bisect_right
 from pathlib import Path
 
-from PyQt5.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QTimer
-from PyQt5.QtGui import QKeySequence, QIcon, QPixmap, QPainter, QFont
+from PyQt5.QtCore import Qt, QSortFilterProxyModel, QAbstractTableModel, QModelIndex, QTimer, QObject, pyqtSignal, QFileSystemWatcher
+from PyQt5.QtGui import QKeySequence, QIcon, QPixmap, QPainter, QFont, QPixmapCache
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QFileSystemModel, QTreeView, QToolBar, QFileDialog,
     QInputDialog, QMessageBox, QLabel, QAbstractItemView,
     QLineEdit, QHeaderView, QPushButton, QSpacerItem, QSizePolicy,
-    QGroupBox, QSplitter, QTabWidget, QTableWidget, QTableWidgetItem,
+    QGroupBox, QSplitter, QTabWidget, QTableView,
     QStyleFactory, QStyledItemDelegate, QFormLayout, QPlainTextEdit,
     QDialog, QDialogButtonBox, QSpinBox, QCheckBox, QComboBox
 )
@@ -174,13 +184,22 @@ DEFAULT_SETTINGS = {
 
 }
 
+# Digest of the settings JSON last read from / written to disk; unchanged saves are skipped
+_SETTINGS_DIGEST: Optional[bytes] = None
+
+def _settings_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
 def load_settings() -> dict:
+    global _SETTINGS_DIGEST
     s = DEFAULT_SETTINGS.copy()
     s["stats"] = DEFAULT_SETTINGS["stats"].copy()
     s["last_file_counters"] = DEFAULT_SETTINGS["last_file_counters"].copy()
     try:
         if SETTINGS_PATH.exists():
-            disk = json.loads(SETTINGS_PATH.read_text(encoding="utf-8"))
+            raw = SETTINGS_PATH.read_text(encoding="utf-8")
+            _SETTINGS_DIGEST = _settings_digest(raw)
+            disk = json.loads(raw)
             for k, v in disk.items():
                 if k == "stats" and isinstance(v, dict):
                     s["stats"].update(v)
@@ -193,6 +212,8 @@ def load_settings() -> dict:
     return s
 
 def save_settings(s: dict):
+    """Write settings only if the JSON changed; atomic (temp file + fsync + os.replace)."""
+    global _SETTINGS_DIGEST
     try:
         out = DEFAULT_SETTINGS.copy()
         out["stats"] = DEFAULT_SETTINGS["stats"].copy()
@@ -204,22 +225,81 @@ def save_settings(s: dict):
                 out["last_file_counters"].update(v)
             else:
                 out[k] = v
-        SETTINGS_PATH.write_text(json.dumps(out, indent=2), encoding="utf-8")
+        text = json.dumps(out, indent=2)
+        digest = _settings_digest(text)
+        if digest == _SETTINGS_DIGEST:
+            return
+        tmp = SETTINGS_PATH.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, SETTINGS_PATH)
+        _SETTINGS_DIGEST = digest
     except Exception:
         pass
 
+# ---------- Markdown file I/O -------------------------------------------------
+def read_md_text(path: Path) -> str:
+    """File text as str: one bytes read + one decode; newlines normalized like read_text()."""
+    text = Path(path).read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+def write_md_text(path: Path, text: str) -> None:
+    """Atomic write (temp file + fsync + os.replace); newlines written as os.linesep, like write_text()."""
+    path = Path(path)
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    tmp = path.with_name(f".{path.name}.tmp")  # hidden, and outside the *.md name filter
+    try:
+        with open(tmp, "wb") as f:
+            f.write(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 # ---------- Git helpers (no UI) -----------------------------------------------
 GIT_TIMEOUT_S = 3  # default wall-clock timeout for git subcommands
-
-def _run(cmd: list[str], cwd: Path) -> tuple[int, str, str]:
+GIT_NET_TIMEOUT_S = 15  # wall-clock timeout for subcommands that talk to a remote
+_GIT_NET_SUBCOMMANDS = {"fetch", "pull", "push", "ls-remote", "clone"}
+GIT_COMMIT_COALESCE_MS = 3000  # saves within this window share one pull + commit
+GIT_SHUTDOWN_WAIT_S = 2 * GIT_NET_TIMEOUT_S  # on close: time for the last pull + commit to finish
+# Per-invocation config: parallel index preload, no auto-gc mid-save; fscache/untracked cache on Windows
+_GIT_PERF_CONFIG = ["-c", "core.preloadindex=true", "-c", "gc.auto=0"]
+if platform.system() == "Windows":
+    _GIT_PERF_CONFIG += ["-c", "core.fscache=true", "-c", "core.untrackedCache=true"]
+_GIT_PERF_CONFIGURED: set[str] = set()  # repos whose .git/config already carries the same settings
+
+def _git_env() -> dict:
+    """Environment for every git child process (non-interactive, no optional locks, bounded network)."""
+    env = os.environ.copy()
+    env.setdefault("GIT_TERMINAL_PROMPT", "0")
+    # Read-only commands (status etc.) skip the opportunistic index.lock refresh
+    env.setdefault("GIT_OPTIONAL_LOCKS", "0")
+    # Keepalives catch an SSH link that dies after connecting (ConnectTimeout only covers the handshake)
+    env.setdefault(
+        "GIT_SSH_COMMAND",
+        "ssh -o BatchMode=yes -o ConnectTimeout=5 -o ServerAliveInterval=5 -o ServerAliveCountMax=2"
+        " -o StrictHostKeyChecking=accept-new"
+    )
+    # HTTPS: abort transfers slower than 1 KB/s for 10 s
+    env.setdefault("GIT_HTTP_LOW_SPEED_LIMIT", "1000")
+    env.setdefault("GIT_HTTP_LOW_SPEED_TIME", "10")
+    return env
+
+def _run(cmd: list[str], cwd: Path, timeout: float = GIT_TIMEOUT_S) -> tuple[int, str, str]:
+    """Run cmd; (-999, "", "timeout") if it outlives `timeout` seconds (the process is killed)."""
     _dbg(f"GIT RUN: {' '.join(shlex.quote(x) for x in cmd)}  (cwd={cwd})")
     try:
-        env = os.environ.copy()
-        env.setdefault("GIT_TERMINAL_PROMPT", "0")
-        env.setdefault(
-            "GIT_SSH_COMMAND",
-            "ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=accept-new"
-        )
+        env = _git_env()
         p = subprocess.Popen(
             cmd, cwd=str(cwd),
             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
@@ -227,12 +307,15 @@ def _run(cmd: list[str], cwd: Path) -> tuple[int, str, str]:
         )
 
         try:
-            out, err = p.communicate(timeout=GIT_TIMEOUT_S)
+            out, err = p.communicate(timeout=timeout)
         except subprocess.TimeoutExpired:
             try:
                 p.kill()
+                # Reap the child and close its pipes; bounded, since a surviving ssh may hold them open
+                p.communicate(timeout=1)
             except Exception:
                 pass
+            _dbg(f"GIT TIMEOUT after {timeout}s")
             return -999, "", "timeout"
 
         rc = p.returncode
@@ -244,59 +327,203 @@ def _run(cmd: list[str], cwd: Path) -> tuple[int, str, str]:
 
 def _git(cwd: Path, *args: str) -> tuple[int, str, str]:
     _dbg(f"GIT: git {' '.join(args)}")
-    return _run(["git", *args], cwd)
+    timeout = GIT_NET_TIMEOUT_S if (args and args[0] in _GIT_NET_SUBCOMMANDS) else GIT_TIMEOUT_S
+    return _run(["git", *_GIT_PERF_CONFIG, *args], cwd, timeout)
+
+# Shared pool for independent read-only git probes (status / rev-parse / remote)
+_GIT_PROBE_POOL: Optional[ThreadPoolExecutor] = None
+
+def _git_probe_pool() -> ThreadPoolExecutor:
+    global _GIT_PROBE_POOL
+    if _GIT_PROBE_POOL is None:
+        _GIT_PROBE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="git-probe")
+    return _GIT_PROBE_POOL
+
+def git_probe_all(repo_root: Path, *arg_lists) -> list[tuple[int, str, str]]:
+    """Run independent read-only git commands concurrently; results in argument order."""
+    futs = [_git_probe_pool().submit(_git, repo_root, *args) for args in arg_lists]
+    return [f.result() for f in futs]
+
+# Remote names per repo; they only change through ensure_git_repo(), which refreshes this
+_GIT_REMOTES_CACHE: dict[str, list[str]] = {}
+
+def git_remotes(repo_root: Path, refresh: bool = False) -> list[str]:
+    """Return `git remote` names for repo_root, cached until refresh=True."""
+    key = str(repo_root)
+    if refresh or key not in _GIT_REMOTES_CACHE:
+        rc, out, _ = _git(repo_root, "remote")
+        if rc != 0:
+            return []  # don't cache failures/timeouts
+        _GIT_REMOTES_CACHE[key] = out.splitlines()
+    return _GIT_REMOTES_CACHE[key]
+
+class _GitCatFile:
+    """
+    Long-lived `git cat-file --batch-check` process for object lookups.
+    One pipe round-trip per query instead of a fork+exec per query.
+    Replies are read by a helper thread, so a stalled process costs at most GIT_TIMEOUT_S:
+    it is killed (and respawned on the next query) and that query falls back to `git cat-file -t`.
+    """
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self._p: Optional[subprocess.Popen] = None
+        self._replies: "queue.Queue[bytes | None]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _pump(stdout, replies: "queue.Queue[bytes | None]"):
+        for line in iter(stdout.readline, b""):
+            replies.put(line)
+        replies.put(None)  # EOF: the process exited
+
+    def _ensure(self) -> subprocess.Popen:
+        if self._p is None or self._p.poll() is not None:
+            _dbg(f"GIT CAT-FILE: start (cwd={self.repo_root})")
+            self._p = subprocess.Popen(
+                ["git", *_GIT_PERF_CONFIG, "cat-file", "--batch-check"], cwd=str(self.repo_root),
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                bufsize=0, env=_git_env()
+            )
+            self._replies = queue.Queue()  # replies of a previous process never leak into this one
+            threading.Thread(target=self._pump, args=(self._p.stdout, self._replies), daemon=True).start()
+        return self._p
+
+    def object_type(self, spec: str) -> str:
+        """Return the object type for `spec` (e.g. 'blob', 'tree'), or '' if missing."""
+        if "\n" in spec:
+            return ""
+        with self._lock:
+            try:
+                p = self._ensure()
+                p.stdin.write(spec.encode("utf-8") + b"\n")
+                raw = self._replies.get(timeout=GIT_TIMEOUT_S)
+                if raw is None:
+                    raise EOFError("cat-file exited")
+                line = raw.decode("utf-8", errors="replace").strip()
+            except queue.Empty:
+                _dbg(f"GIT CAT-FILE TIMEOUT after {GIT_TIMEOUT_S}s; falling back to cat-file -t")
+                try:
+                    p.kill()  # stalled: no graceful close
+                except Exception:
+                    pass
+                self.close()
+                rc, out, _ = _git(self.repo_root, "cat-file", "-t", spec)
+                return out if rc == 0 else ""
+            except Exception as e:
+                _dbg(f"GIT CAT-FILE EXC: {e}")
+                self.close()
+                return ""
+        # "<sha> <type> <size>" on hit; "<spec> missing" / "<spec> ambiguous" otherwise
+        parts = line.split()
+        return parts[1] if len(parts) == 3 and parts[2].isdigit() else ""
+
+    def close(self):
+        p, self._p = self._p, None
+        if p is not None:
+            try:
+                p.stdin.close()
+                p.wait(timeout=1)
+            except Exception:
+                try:
+                    p.kill()
+                except Exception:
+                    pass
 
 def ensure_git_repo(repo_root: Path, settings: dict) -> None:
     _dbg(f"Ensure repo at: {repo_root}")
     if not (repo_root / ".git").exists():
         _dbg("Repo not initialized → git init")
         _git(repo_root, "init")
-    rc, out, _ = _git(repo_root, "symbolic-ref", "--short", "HEAD")
+    if str(repo_root) not in _GIT_PERF_CONFIGURED:
+        # Persist the same settings so git run outside this tool benefits too
+        _git(repo_root, "config", "core.preloadindex", "true")
+        if platform.system() == "Windows":
+            _git(repo_root, "config", "core.fscache", "true")
+        _GIT_PERF_CONFIGURED.add(str(repo_root))
+    remote = os.environ.get("PARTS_CATALOG_GIT_REMOTE") or (settings.get("git_remote_url") or "").strip()
+    # HEAD and remote probes are independent → run them concurrently
+    pool = _git_probe_pool()
+    f_head = pool.submit(_git, repo_root, "symbolic-ref", "--short", "HEAD")
+    f_rems = pool.submit(git_remotes, repo_root, True) if remote else None
+    rc, out, _ = f_head.result()
     if rc != 0:
         branch = (settings.get("git_branch") or "main").strip() or "main"
         _git(repo_root, "checkout", "-b", branch)
         _dbg(f"Ensure current branch = {(settings.get('git_branch') or 'main')}")
-    remote = os.environ.get("PARTS_CATALOG_GIT_REMOTE") or (settings.get("git_remote_url") or "").strip()
     if remote:
-        rc, remotes, _ = _git(repo_root, "remote")
-        rems = remotes.splitlines() if rc == 0 else []
+        rems = f_rems.result()
         if "origin" not in rems:
             _git(repo_root, "remote", "add", "origin", remote)
+            git_remotes(repo_root, refresh=True)
         else:
             _git(repo_root, "remote", "set-url", "origin", remote)
 
 def git_pull(repo_root: Path, branch: str) -> None:
-    rc, remotes, _ = _git(repo_root, "remote")
-    if rc == 0 and "origin" in remotes.splitlines():
+    if "origin" in git_remotes(repo_root):
         _git(repo_root, "fetch", "origin", branch)
         _git(repo_root, "merge", f"origin/{branch}")
 
-def _highest_rev_from_table(rev_table) -> str:
-    try:
-        rows = rev_table.rowCount()
-        for r in range(rows - 1, -1, -1):
-            it = rev_table.item(r, 0)
-            val = (it.text().strip() if it else "")
-            if val:
-                return val
-    except Exception:
-        pass
+def _highest_rev_from_rows(rev_rows) -> str:
+    """Last non-empty Rev cell (column 0) of the revision rows, or '-'."""
+    for row in reversed(rev_rows):
+        val = row[0].strip() if row else ""
+        if val:
+            return val
     return "-"
 
+_STATUS_SMALL_CHANGESET = 10  # below this, stage changed paths by name instead of 'add -A'
+
+def _parse_status_v2_z(out: str) -> list[str]:
+    """Changed paths (repo-root relative) from 'git status --porcelain=v2 -z'; renames yield the new name."""
+    paths = []
+    recs = out.split("\0")
+    i = 0
+    while i < len(recs):
+        rec = recs[i]
+        i += 1
+        if not rec:
+            continue
+        kind = rec[0]
+        if kind == "1":      # ordinary change: 8 fields, then the path
+            paths.append(rec.split(" ", 8)[-1])
+        elif kind == "2":    # rename/copy: 9 fields, path, then the original path as its own record
+            paths.append(rec.split(" ", 9)[-1])
+            i += 1           # the original is already gone from the index
+        elif kind == "u":    # unmerged: 10 fields, then the path
+            paths.append(rec.split(" ", 10)[-1])
+        elif kind == "?":    # untracked
+            paths.append(rec[2:])
+    return paths
+
+def git_changed_paths(repo_root: Path, *pathspec: str) -> Optional[list[str]]:
+    """
+    One 'status --porcelain=v2 -z' call: changed/untracked paths (optionally limited to `pathspec`),
+    [] when clean, None if git failed (caller falls back to add + diff --cached).
+    """
+    args = ["status", "--porcelain=v2", "-z", "--untracked-files=all"]
+    if pathspec:
+        args += ["--", *pathspec]
+    rc, out, _ = _git(repo_root, *args)
+    if rc != 0:
+        return None
+    return _parse_status_v2_z(out)
+
+def _top_pathspecs(rel_paths: list[str]) -> list[str]:
+    """Repo-root relative status paths → pathspecs that work from any cwd and never glob."""
+    return [f":(top,literal){p}" for p in rel_paths]
+
 def git_commit_paths(repo_root: Path, message: str, paths: list[Path]) -> bool:
     if not paths:
         return False
-    for p in paths:
-        _git(repo_root, "add", str(p))
-    rc, _, _ = _git(repo_root, "diff", "--cached", "--quiet")
-    if rc == 0:
+    path_args = [str(p) for p in paths]
+    if git_changed_paths(repo_root, *path_args) == []:
         return False
-    rc, _, _ = _git(repo_root, "commit", "-m", message)
+    _git(repo_root, "add", "--", *path_args)
+    rc, _, _ = _git(repo_root, "commit", "-m", message, "--", *path_args)
     return rc == 0
 
 def git_push(repo_root: Path, branch: str) -> None:
-    rc, remotes, _ = _git(repo_root, "remote")
-    if rc == 0 and "origin" in remotes.splitlines():
+    if "origin" in git_remotes(repo_root):
         _git(repo_root, "push", "origin", f"HEAD:{branch}")
 
 # ---------- App data model constants ------------------------------------------
@@ -309,6 +536,8 @@ FIELD_ORDER = [
     ("Performance Feedback", "Exists / Does Not Exist"),
     ("Verified Performance", "Yes / No"),
 ]
+# Left half of each Introduction row ("| <Field padded to 22> | "); FIELD_ORDER is fixed
+_INTRO_ROW_PREFIXES = tuple(f"| {k:<22} | " for k, _ in FIELD_ORDER)
 REV_HEADERS = ["Rev", "Date", "Description", "By"]
 PARTLIST_HEADERS = ["Ref Des", "Type", "Value/Description"]
 VARIANT_HEADERS = ["Item"]
@@ -320,32 +549,358 @@ def today_iso():
 def now_stamp():
     return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
+try:
+    import orjson  # optional: C JSON parser for hot metadata reads
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+def json_loads_bytes(data: bytes):
+    """Parse UTF-8 JSON bytes with orjson when available, else the stdlib."""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def json_dumps_indent(obj) -> bytes:
+    """
+    json.dumps(obj, indent=2) as the bytes write_text() would store (UTF-8, os.linesep newlines).
+    orjson is used when available and its output is the same (pure ASCII, no raw DEL).
+    """
+    data = None
+    if _HAS_ORJSON:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+        if data is not None and (not data.isascii() or b"\x7f" in data):
+            data = None  # json.dumps would \u-escape these characters
+    if data is None:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    if os.linesep != "\n":
+        data = data.replace(b"\n", os.linesep.encode("ascii"))
+    return data
+
+def zip_folder(folder: Path, zip_path: Path, exclude_dirs: frozenset = frozenset(), progress=None) -> int:
+    """
+    Zip `folder` (arcnames start with the folder's own name) in a single os.walk pass,
+    streaming each file into the archive. Directories named in exclude_dirs are pruned.
+    progress(files_done) is called every 100 files. Returns the number of files written.
+    """
+    base = folder.parent
+    done = 0
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=6) as zf:
+        for dirpath, dirnames, filenames in os.walk(folder):
+            dirnames[:] = sorted(d for d in dirnames if d not in exclude_dirs)
+            rel_dir = os.path.relpath(dirpath, base)  # once per directory, joined per file
+            zf.write(dirpath, rel_dir)
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                if os.path.isfile(path):
+                    zf.write(path, os.path.join(rel_dir, name))
+                    done += 1
+                    if progress is not None and done % 100 == 0:
+                        progress(done)
+    return done
+
+def _copy_text_rstrip_newlines(src, put, chunk: int = 1 << 20) -> None:
+    """
+    Stream text src → put(str) in chunks, dropping trailing newlines (like content.rstrip("\\n"))
+    without holding the whole file.
+    """
+    held = 0  # run of "\n" seen at the end of what was read so far, not yet written
+    for buf in iter(lambda: src.read(chunk), ""):
+        body = buf.rstrip("\n")
+        if body:
+            put("\n" * held + body)
+            held = len(buf) - len(body)
+        else:
+            held += len(buf)
+
+# `entry="<file name>"` on an import's ```markdown fence line
+_IMPORT_ENTRY_RE = re.compile(r'entry\s*=\s*"([^"]+)"')
+
 def folder_meta_path(folder: Path) -> Path:
     return folder / f"{folder.name}.json"
 
-MD_ROW_RE = re.compile(r'^\|\s*(?P<field>[^|]+?)\s*\|\s*(?P<value>[^|]*?)\s*\|$')
+def _stat_is(path: Path, mode_test) -> bool:
+    """Single os.stat() + mode check (e.g. stat.S_ISREG); False if the path is missing."""
+    try:
+        return mode_test(os.stat(path).st_mode)
+    except OSError:
+        return False
+
 DIVIDER_CELL_RE = re.compile(r'^:?-{2,}:?$')
 
+# All "## <Title>" sections parse_markdown reads (lower-cased); found by _classify_lines
+_PARSED_SECTION_TITLES = ("Revision History", "Variant Details", "Netlist", "Partlist", *SECTION_TITLES.values())
+_PARSED_SECTION_KEYS = frozenset(t.lower() for t in _PARSED_SECTION_TITLES)
+_FIELD_KEYS = tuple(k for k, _ in FIELD_ORDER)
+
+# Case variants of ".md" for str.endswith (avoids a lower() copy per filename)
+_MD_SUFFIXES = (".md", ".MD", ".Md", ".mD")
+_PDF_SUFFIXES = tuple(f".{p}{d}{f}" for p in "pP" for d in "dD" for f in "fF")
+_MD_PDF_SUFFIXES = _MD_SUFFIXES + _PDF_SUFFIXES
+
+# Directories never walked for counts/stats (hidden directories are skipped as well)
+_SKIP_DIR_NAMES = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".pytest_cache",
+    ".ruff_cache", "node_modules", "build", "dist", ".venv", "venv"
+})
+# Extensions counted toward stats["lines_total"] (lower-case, matched on a lower-cased suffix)
+_TEXT_EXTS = frozenset({
+    ".md", ".txt", ".json", ".py", ".yml", ".yaml", ".ini", ".cfg", ".toml",
+    ".csv", ".bat", ".ps1"
+})
+_STATS_MAX_FILE_BYTES = 2_000_000  # skip unusually large files
+# File-name prefixes (lower-case) of concatenated exports: read-only in the editor, no line stats
+_EXPORT_NAME_PREFIXES = ("catlog_", "catalog_")
+_STATS_READ_CHUNK = 1 << 20
+_O_RDONLY_BINARY = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+def _count_file_lines(path: str, size: Optional[int] = None) -> int:
+    """
+    Lines as text-mode iteration counts them (last line may lack '\\n'); C-level byte counting.
+    size: st_size from a stat the caller already made (skips the fstat; 0 skips the open).
+    """
+    if size == 0:
+        return 0
+    if size is not None and size < _STATS_READ_CHUNK:
+        # Small file of known size: raw descriptor, no file object. Reads up to the stat'd size
+        # (a short read is retried; a file that grew since is recounted under its new cache key)
+        fd = os.open(path, _O_RDONLY_BINARY)
+        try:
+            buf = os.read(fd, size)
+            while len(buf) < size:
+                more = os.read(fd, size - len(buf))
+                if not more:
+                    break  # shrank since the stat
+                buf += more
+        finally:
+            os.close(fd)
+        n = buf.count(b"\n")
+        return n + (0 if not buf or buf.endswith(b"\n") else 1)
+    with open(path, "rb", buffering=0) as f:
+        if size is None:
+            size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return 0
+        if size < _STATS_READ_CHUNK:
+            buf = f.read()
+            n = buf.count(b"\n")
+            return n + (0 if not buf or buf.endswith(b"\n") else 1)
+        # Larger files: fixed-size chunks into one reused buffer
+        n = 0
+        buf = bytearray(_STATS_READ_CHUNK)
+        last = 0x0A  # nothing read (file shrank since the stat) → 0 lines
+        while True:
+            got = f.readinto(buf)
+            if not got:
+                break
+            n += buf.count(b"\n", 0, got)  # partial last chunk: count in place, no copy
+            last = buf[got - 1]
+        return n + (0 if last == 0x0A else 1)
+
+def _iter_md_entries(root: str):
+    """
+    DirEntry for every *.md under `root` (any case), found with os.scandir.
+    Walks like os.walk(followlinks=False): symlinked directories are listed but not descended.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.endswith(_MD_SUFFIXES):
+                        yield entry
+                except OSError:
+                    continue
+
+_STATS_PARALLEL_MIN = 64  # uncached files before line counting fans out to threads
+_STATS_FULL_RESCAN_S = 300  # saves within this long of a full walk only recount the saved file
+
+def compute_repo_stats(root: Path, line_cache: Optional[dict] = None) -> tuple[int, int]:
+    """
+    (*.md files, lines in text files) under `root` in one os.scandir pass.
+    Skips VCS/venv/build/hidden directories and never descends symlinked ones.
+    line_cache: path → (mtime_ns, size, lines), reused for unchanged files and
+    rewritten in place (deleted files drop out); only new/changed files are read.
+    """
+    md_total = 0
+    lines_total = 0
+    fresh: dict[str, tuple[int, int, int]] = {}
+    misses: list[tuple[str, int, int]] = []
+    old = line_cache if line_cache is not None else {}
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name[:1] != "." and name not in _SKIP_DIR_NAMES:
+                            stack.append(entry.path)
+                        continue
+                    if name.endswith(_MD_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                        md_total += 1
+                    # Suffix as os.path.splitext sees it (a leading dot alone is not one)
+                    dot = name.rfind(".")
+                    if dot <= 0 or name[dot:].lower() not in _TEXT_EXTS:
+                        continue
+                    if name.lower().startswith(_EXPORT_NAME_PREFIXES):
+                        continue  # derived data, can outweigh the real catalog
+                    st = entry.stat()  # cached on the DirEntry (free on Windows); symlinks → target
+                    if st.st_size > _STATS_MAX_FILE_BYTES:
+                        continue
+                    if st.st_size == 0:
+                        fresh[entry.path] = (st.st_mtime_ns, 0, 0)  # nothing to open
+                        continue
+                    hit = old.get(entry.path)
+                    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                        fresh[entry.path] = hit
+                        lines_total += hit[2]
+                    else:
+                        misses.append((entry.path, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    continue  # ignore unreadable files
+
+    def _count_slice(batch):
+        out = []
+        for miss in batch:
+            try:
+                out.append((miss, _count_file_lines(miss[0], miss[2])))
+            except OSError:
+                pass
+        return out
+
+    if len(misses) >= _STATS_PARALLEL_MIN:
+        # Threads, not processes: the work is read() + bytes.count() and a spawned worker
+        # would re-import PyQt5. One contiguous slice per task keeps future overhead per worker.
+        workers = min(8, os.cpu_count() or 4)
+        step = -(-len(misses) // (workers * 4))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="line-count") as ex:
+            parts = list(ex.map(_count_slice, (misses[i:i + step] for i in range(0, len(misses), step))))
+    else:
+        parts = [_count_slice(misses)]
+    for counted in parts:
+        for (path, mtime_ns, size), n in counted:
+            fresh[path] = (mtime_ns, size, n)
+            lines_total += n
+
+    if line_cache is not None:
+        line_cache.clear()
+        line_cache.update(fresh)
+    return md_total, lines_total
+
+# Per-file line counts survive restarts here (validated by mtime + size on use);
+# a hidden folder, so the stats walk never counts the cache itself
+STATS_CACHE_PATH = _script_dir() / ".cache" / "line_counts.json"
+
+def load_line_cache(root: Path) -> dict:
+    """Persisted compute_repo_stats line_cache for `root` ({} if missing or for another root)."""
+    try:
+        data = json_loads_bytes(STATS_CACHE_PATH.read_bytes())
+        if data.get("root") != os.fspath(root):
+            return {}
+        return {p: (int(m), int(sz), int(n)) for p, (m, sz, n) in data.get("lines", {}).items()}
+    except Exception:
+        return {}
+
+def save_line_cache(root: Path, cache: dict) -> None:
+    """Atomic write of the line_cache (temp file + os.replace)."""
+    try:
+        STATS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = STATS_CACHE_PATH.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"root": os.fspath(root), "lines": cache}, f, separators=(",", ":"))
+        os.replace(tmp, STATS_CACHE_PATH)
+    except Exception:
+        pass
+
 def _divider_for(headers):
     return "| " + " | ".join("-" * len(h) for h in headers) + " |"
 
-def _is_md_divider_line(line: str) -> bool:
-    s = line.strip()
-    if not (s.startswith("|") and s.endswith("|")):
-        return False
-    cells = [c.strip() for c in s.strip().strip("|").split("|")]
-    if not cells:
-        return False
-    return all(DIVIDER_CELL_RE.fullmatch(c) for c in cells)
+# Header + divider lines of the fixed-column tables, built once at import
+_REV_TABLE_HEAD = (f"| {' | '.join(REV_HEADERS)} |", _divider_for(REV_HEADERS))
+_PARTLIST_TABLE_HEAD = (f"| {' | '.join(PARTLIST_HEADERS)} |", _divider_for(PARTLIST_HEADERS))
+_INTRO_TABLE_HEAD = (
+    "| Field                  | Value                     |",
+    "| ---------------------- | ------------------------- |",
+)
+
+# Header + divider used when a Partlist section has no body (constant)
+_PARTLIST_EMPTY_TABLE = "\n".join(_PARTLIST_TABLE_HEAD)
+
+# Whole divider row, e.g. "| --- | :--: |"; leading/trailing pipe runs behave like str.strip("|")
+DIVIDER_LINE_RE = re.compile(r'\|+\s*:?-{2,}:?\s*(?:\|\s*:?-{2,}:?\s*)*\|+')
+
+# Line-kind bit flags, computed once per document by _classify_lines()
+_LK_HEADER2 = 1   # "## ..." at column 0
+_LK_TABLE = 2     # "|..." (leading whitespace allowed: hand-edited/imported files indent tables)
+_LK_BULLET = 4    # "- item" / "* item"
+_LK_DIVIDER = 8   # table divider row (| --- | --- |)
+_LK_BLANK = 16    # empty or whitespace-only
+
+def _classify_lines(lines, sections: Optional[dict] = None, heads: Optional[list] = None,
+                    stripped: Optional[list] = None) -> list:
+    """
+    One pass over the document: a kind bitmask per line, shared by the parse helpers.
+    sections: filled with lower-cased title → index of the first "## <Title>" line (leading
+    whitespace allowed) for each title in _PARSED_SECTION_KEYS.
+    heads: filled with the (ascending) indices of every _LK_HEADER2 line, i.e. section ends.
+    stripped: filled with line.strip() for every line (so the helpers never strip again).
+    """
+    kinds = []
+    append = kinds.append
+    divider_match = DIVIDER_LINE_RE.fullmatch
+    keep = stripped.append if stripped is not None else None
+    for i, ln in enumerate(lines):
+        s = ln.strip()
+        if keep is not None:
+            keep(s)
+        if not s:
+            append(_LK_BLANK)
+            continue
+        # Dispatch on the first visible character; most lines are prose and match none
+        c = s[0]
+        if c == "#":
+            if sections is not None and s.startswith("## "):
+                key = s[3:].lower()
+                if key in _PARSED_SECTION_KEYS and key not in sections:
+                    sections[key] = i
+            if ln.startswith("## "):
+                if heads is not None:
+                    heads.append(i)
+                append(_LK_HEADER2)
+                continue
+        elif c == "|":
+            # Every divider cell has at least "--"; skip the regex for ordinary rows
+            append(_LK_TABLE | _LK_DIVIDER if "--" in s and divider_match(s) is not None else _LK_TABLE)
+            continue
+        elif (c == "-" or c == "*") and s.startswith(("- ", "* ")):
+            append(_LK_BULLET)
+            continue
+        append(0)
+    return kinds
 
 def _is_divider_cells(cells: list) -> bool:
     return bool(cells) and all(DIVIDER_CELL_RE.fullmatch((c or "").strip()) for c in cells)
 
 # ---------- NEW ENTRY TEMPLATE -------------------------------------------------
-def _new_entry_template(default_owner: str) -> str:
-    return (f"""# Circuit Metadata
+# Built once at import; only the date and owner vary per new file (str.format fields)
+_NEW_ENTRY_TEMPLATE = (f"""# Circuit Metadata
 
-**Last Updated:** {today_iso()}
+**Last Updated:** {{today}}
 
 ## Introduction
 
@@ -361,9 +916,9 @@ def _new_entry_template(default_owner: str) -> str:
 
 ## Revision History
 
-| {' | '.join(REV_HEADERS)} |
-{_divider_for(REV_HEADERS)}
-| - | {today_iso()} | Initial release | {default_owner} |
+{_REV_TABLE_HEAD[0]}
+{_REV_TABLE_HEAD[1]}
+| - | {{today}} | Initial release | {{owner}} |
 
 ## Variant Details
 
@@ -375,8 +930,7 @@ def _new_entry_template(default_owner: str) -> str:
 
 ## Partlist
 
-| {" | ".join(PARTLIST_HEADERS)} |
-{_divider_for(PARTLIST_HEADERS)}
+{_PARTLIST_EMPTY_TABLE}
 
 ## {SECTION_TITLES['cd']}
 
@@ -391,6 +945,9 @@ def _new_entry_template(default_owner: str) -> str:
 (design tradeoffs, margins, component selection rationale, SOA, derating…)
 """).strip() + "\n"
 
+def _new_entry_template(default_owner: str) -> str:
+    return _NEW_ENTRY_TEMPLATE.format(today=today_iso(), owner=default_owner)
+
 # ---------- PDF Viewer (lazy, multi-page) -------------------------------------
 try:
     import fitz  # PyMuPDF
@@ -399,20 +956,142 @@ except Exception:
     _HAS_FITZ = False
 
 from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QLabel, QScrollBar
-from PyQt5.QtGui import QImage, QPixmap, QPainter
-from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPen, QBrush
+from PyQt5.QtCore import Qt, QPoint, QRectF
+
+_PDF_ZOOM = 2          # render scale (~144 dpi)
+_PDF_PAGE_GAP = 12     # vertical gap between pages (scene px)
+_PDF_PAGES_KEPT = 8    # rendered pages held in memory per view (at least what is visible)
+# Rendered pages as PNG, one subfolder per (pdf path, mtime, dpi); hidden, so never counted or listed
+PDF_CACHE_DIR = _script_dir() / ".pdf_cache"
+PDF_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+_PDF_RENDER_POOL: Optional[ThreadPoolExecutor] = None
+
+def _pdf_render_pool() -> ThreadPoolExecutor:
+    """Single worker: a PyMuPDF document is only ever touched by one thread."""
+    global _PDF_RENDER_POOL
+    if _PDF_RENDER_POOL is None:
+        _PDF_RENDER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-render")
+    return _PDF_RENDER_POOL
+
+def _pdf_cache_key(path: str) -> str:
+    """Cache subfolder name for `path`; changes whenever the PDF (or the render dpi) does."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return ""
+    return hashlib.blake2b(f"{path}:{mtime_ns}:{_PDF_ZOOM * 72}".encode("utf-8")).hexdigest()[:16]
+
+def _pdf_cache_trim(keep: str = ""):
+    """Render-thread job: drop the least recently written document folders beyond PDF_CACHE_MAX_BYTES."""
+    folders = []
+    try:
+        with os.scandir(PDF_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                size = 0
+                with os.scandir(entry.path) as files:
+                    for f in files:
+                        try:
+                            size += f.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+                folders.append((entry.stat(follow_symlinks=False).st_mtime, size, entry))
+    except OSError:
+        return
+    total = sum(size for _, size, _ in folders)
+    for _, size, entry in sorted(folders, key=lambda t: t[0]):
+        if total <= PDF_CACHE_MAX_BYTES:
+            break
+        if entry.name == keep:
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+        total -= size
+
+def _pdf_read_page_sizes(cache_key: str) -> Optional[list]:
+    """Page sizes (PDF points) saved alongside the cached PNGs; None if not cached yet."""
+    if not cache_key:
+        return None
+    try:
+        with open(PDF_CACHE_DIR / cache_key / "pages.json", "rb") as f:
+            sizes = json_loads_bytes(f.read())
+        return [(float(w), float(h)) for w, h in sizes]
+    except Exception:
+        return None
+
+def _pdf_write_page_sizes(cache_key: str, sizes: list) -> bool:
+    """Save page sizes for cache_key; True if this created the cache folder."""
+    if not cache_key:
+        return False
+    try:
+        folder = PDF_CACHE_DIR / cache_key
+        new_dir = not folder.exists()
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / "pages.json").write_text(json.dumps(sizes), encoding="utf-8")
+        return new_dir
+    except Exception:
+        return False
+
+def _pdf_prewarm_first_page(path: str):
+    """Render-thread job: cache page sizes and page 0 as PNG so the first view opens from disk."""
+    key = _pdf_cache_key(path)
+    if not key:
+        return
+    png = PDF_CACHE_DIR / key / "page_0.png"
+    if png.exists() and _pdf_read_page_sizes(key) is not None:
+        return
+    try:
+        doc = fitz.open(path)
+    except Exception:
+        return
+    try:
+        new_dir = _pdf_write_page_sizes(key, [(p.rect.width, p.rect.height) for p in doc])
+        if len(doc) and not png.exists():
+            pix = doc.load_page(0).get_pixmap(matrix=fitz.Matrix(_PDF_ZOOM, _PDF_ZOOM), alpha=False)
+            pix.save(str(png))
+        if new_dir:
+            _pdf_cache_trim(keep=key)
+    except Exception:
+        pass
+    finally:
+        doc.close()
+
+def _pdf_close_render_doc(state: dict):
+    """Render-thread job: release the document a view was rendering from."""
+    doc = state.pop("doc", None)
+    state.pop("path", None)
+    if doc is not None:
+        try:
+            doc.close()
+        except Exception:
+            pass
 
 class PDFGraphicsView(QGraphicsView):
     """
     Minimal multi-page PDF renderer using PyMuPDF.
-    - Renders all pages vertically in a single QGraphicsScene.
+    - Lays out all pages vertically in a single QGraphicsScene (blank placeholders first).
+    - Renders only pages near the viewport, off the UI thread; keeps a few in memory.
     - Normal wheel scroll; Ctrl + wheel for zoom; left-drag to pan.
     """
+    # generation, page index, rendered page, object owning the page's pixels (or None)
+    page_ready = pyqtSignal(int, int, QImage, object)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._scene = QGraphicsScene(self)
         self.setScene(self._scene)
         self._pages: list[QGraphicsPixmapItem] = []
+        self._page_rects: list[QRectF] = []
+        self._rendered: OrderedDict[int, None] = OrderedDict()  # LRU of pages holding a pixmap
+        self._pending: set[int] = set()
+        self._keep = _PDF_PAGES_KEPT
+        self._path = ""
+        self._cache_key = ""  # PDF_CACHE_DIR subfolder for the current document ("" → no disk cache)
+        self._gen = 0  # bumped on clear(); late renders for an old document are dropped
+        # Render-thread state ({"path", "doc"}); only touched by _pdf_render_pool() jobs
+        self._render_state: dict = {}
         self._panning = False
         self._last_pos = QPoint()
         self._scale = 1.0
@@ -424,12 +1103,16 @@ class PDFGraphicsView(QGraphicsView):
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self.setMouseTracking(True)
 
+        self.page_ready.connect(self._on_page_ready)
+        state = self._render_state
+        self.destroyed.connect(lambda *_: _pdf_render_pool().submit(_pdf_close_render_doc, state))
+
     def fit_to_width(self):
         """Scale so the widest page fits the viewport width."""
-        if not self._pages:
+        if not self._page_rects:
             return
-        # Width of the widest rendered page (scene units = pixels at current transform=identity)
-        page_width = max(p.pixmap().width() for p in self._pages if p.pixmap() and not p.pixmap().isNull())
+        # Width of the widest page (scene units = pixels at current transform=identity)
+        page_width = max(r.width() for r in self._page_rects)
         if page_width <= 0:
             return
 
@@ -443,10 +1126,18 @@ class PDFGraphicsView(QGraphicsView):
         # Scroll to top-left so page isn't “cropped” from the left
         self.horizontalScrollBar().setValue(self.horizontalScrollBar().minimum())
         self.verticalScrollBar().setValue(self.verticalScrollBar().minimum())
+        self._request_visible_pages()
 
     def clear(self):
+        self._gen += 1
         self._scene.clear()
         self._pages.clear()
+        self._page_rects.clear()
+        self._rendered.clear()
+        self._pending.clear()
+        self._path = ""
+        self._cache_key = ""
+        _pdf_render_pool().submit(_pdf_close_render_doc, self._render_state)
         self.resetTransform()
         self._scale = 1.0
 
@@ -455,34 +1146,124 @@ class PDFGraphicsView(QGraphicsView):
         if not _HAS_FITZ:
             self._scene.addText("PyMuPDF (fitz) not installed.\n\npip install pymupdf")
             return
-        try:
-            doc = fitz.open(path)
-        except Exception as e:
-            self._scene.addText(f"Failed to open PDF:\n{path}\n\n{e}")
-            return
-
-        y = 0
-        for i in range(len(doc)):
-            page = doc.load_page(i)
-            # Render at 144 dpi-ish (2x), adjust if you want sharper
-            mat = fitz.Matrix(2, 2)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
-            img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-            pm = QPixmap.fromImage(img)
-            item = QGraphicsPixmapItem(pm)
+        cache_key = _pdf_cache_key(path)
+        # Page sizes come from the cache when this PDF version was opened (or pre-warmed) before
+        sizes = _pdf_read_page_sizes(cache_key)
+        if sizes is None:
+            try:
+                doc = fitz.open(path)
+            except Exception as e:
+                self._scene.addText(f"Failed to open PDF:\n{path}\n\n{e}")
+                return
+            try:
+                sizes = [(page.rect.width, page.rect.height) for page in doc]
+            finally:
+                doc.close()
+            if _pdf_write_page_sizes(cache_key, sizes):
+                _pdf_render_pool().submit(_pdf_cache_trim, cache_key)
+
+        # Page boxes only; nothing is rasterized here
+        y = 0.0
+        for w, h in sizes:
+            rect = QRectF(0, y, w * _PDF_ZOOM, h * _PDF_ZOOM)
+            self._scene.addRect(rect, QPen(Qt.NoPen), QBrush(Qt.white))
+            item = QGraphicsPixmapItem()
             item.setPos(0, y)
             self._scene.addItem(item)
             self._pages.append(item)
-            y += pm.height() + 12  # vertical gap
+            self._page_rects.append(rect)
+            y += rect.height() + _PDF_PAGE_GAP
+        self._path = path
+        self._cache_key = cache_key
 
-        # Fit to page width by default
+        # Fit to page width by default (also requests the first visible pages)
         self._user_zoomed = False
         self.fit_to_width()
 
+    # ---- lazy page rendering ----
+    def _request_visible_pages(self):
+        """Queue renders for pages in (or half a screen around) the viewport."""
+        if not self._page_rects:
+            return
+        view_r = self.mapToScene(self.viewport().rect()).boundingRect()
+        margin = view_r.height() / 2
+        view_r.adjust(0, -margin, 0, margin)
+        visible = 0
+        for i, r in enumerate(self._page_rects):
+            if r.bottom() < view_r.top():
+                continue
+            if r.top() > view_r.bottom():
+                break
+            visible += 1
+            if i in self._rendered:
+                self._rendered.move_to_end(i)
+            elif i not in self._pending:
+                self._pending.add(i)
+                _pdf_render_pool().submit(self._render_page_job, self._gen, self._path, self._cache_key, i)
+        self._keep = max(_PDF_PAGES_KEPT, visible)
+
+    def _render_page_job(self, gen: int, path: str, cache_key: str, i: int):
+        """Render thread: load page i from the PNG cache (or rasterize it) and hand it to the UI thread."""
+        if gen != self._gen:
+            return  # document replaced while queued
+        try:
+            cache_png = PDF_CACHE_DIR / cache_key / f"page_{i}.png" if cache_key else None
+            img = QImage(str(cache_png)) if cache_png is not None else QImage()
+            backing = None
+            if img.isNull():
+                img, backing = self._rasterize_page(path, i, cache_png)
+            self.page_ready.emit(gen, i, img, backing)  # queued to the UI thread
+        except Exception:
+            pass  # view gone or page unreadable; placeholder stays blank
+
+    def _rasterize_page(self, path: str, i: int, cache_png: Path | None) -> tuple[QImage, object]:
+        """Rasterize page i; returns a QImage viewing MuPDF's buffer plus the pixmap that owns it."""
+        state = self._render_state
+        if state.get("path") != path:
+            _pdf_close_render_doc(state)
+            state["doc"] = fitz.open(path)
+            state["path"] = path
+        page = state["doc"].load_page(i)
+        pix = page.get_pixmap(matrix=fitz.Matrix(_PDF_ZOOM, _PDF_ZOOM), alpha=False)
+        if cache_png is not None:
+            try:
+                new_dir = not cache_png.parent.exists()
+                cache_png.parent.mkdir(parents=True, exist_ok=True)
+                pix.save(str(cache_png))  # MuPDF's own PNG encoder
+                if new_dir:
+                    _pdf_cache_trim(keep=cache_png.parent.name)
+            except Exception:
+                pass
+        # No copy: the QImage views MuPDF's buffer, which lives as long as `pix` does
+        try:
+            samples = pix.samples_mv
+        except AttributeError:  # PyMuPDF < 1.18.17
+            samples = pix.samples
+        return QImage(samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888), pix
+
+    def _on_page_ready(self, gen: int, i: int, img: QImage, backing=None):
+        if gen != self._gen or i >= len(self._pages):
+            return
+        self._pending.discard(i)
+        # The one copy into the pixmap; keep RGB888 instead of converting to the native format.
+        # `backing` (the MuPDF pixmap) only has to outlive this call.
+        self._pages[i].setPixmap(QPixmap.fromImage(img, Qt.NoFormatConversion))
+        self._rendered[i] = None
+        self._rendered.move_to_end(i)
+        while len(self._rendered) > self._keep:
+            old, _ = self._rendered.popitem(last=False)
+            self._pages[old].setPixmap(QPixmap())  # back to the blank placeholder
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self._request_visible_pages()
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if not self._user_zoomed:
             self.fit_to_width()
+        else:
+            self._request_visible_pages()
 
     # Zoom only when Ctrl is pressed
     def wheelEvent(self, event):
@@ -492,6 +1273,7 @@ class PDFGraphicsView(QGraphicsView):
             self._scale = max(0.1, min(5.0, self._scale * factor))
             self.scale(factor, factor)
             self._user_zoomed = True
+            self._request_visible_pages()
         else:
             super().wheelEvent(event)
 
@@ -518,7 +1300,14 @@ class PDFGraphicsView(QGraphicsView):
         super().mouseReleaseEvent(event)
 
 # ---------- Icon helper -------------------------------------------------------
-def make_emoji_icon(emoji: str, px: int = 256) -> QIcon:
+_EMOJI_ICON_SIZES = (16, 24, 32, 64)  # rendered natively besides the requested size
+
+def _emoji_pixmap(emoji: str, px: int) -> QPixmap:
+    """Emoji rendered at px×px; kept in QPixmapCache so repeat requests skip the font raster."""
+    key = f"emoji:{emoji}:{px}"
+    pm = QPixmapCache.find(key)
+    if pm is not None and not pm.isNull():
+        return pm
     pm = QPixmap(px, px)
     pm.fill(Qt.transparent)
     painter = QPainter(pm)
@@ -530,10 +1319,30 @@ def make_emoji_icon(emoji: str, px: int = 256) -> QIcon:
         painter.drawText(rect, Qt.AlignCenter, emoji)
     finally:
         painter.end()
-    return QIcon(pm)
+    QPixmapCache.insert(key, pm)
+    return pm
+
+def make_emoji_icon(emoji: str, px: int = 256) -> QIcon:
+    """Multi-resolution icon: small sizes are drawn at their own size instead of downscaled."""
+    icon = QIcon()
+    for size in _EMOJI_ICON_SIZES:
+        if size < px:
+            icon.addPixmap(_emoji_pixmap(emoji, size))
+    icon.addPixmap(_emoji_pixmap(emoji, px))
+    return icon
 
 # ---------- Proxy model for tree ---------------------------------------------
+_DESC_CACHE_MAX = 2048  # Description titles kept (and .md files watched) at most
+_DESC_QUEUE_MAX = 1024   # Description reads waiting for the reader thread
+_DESC_PENDING = "…"      # shown until a Description has been read
+_DESC_REPAINT_MS = 16    # Descriptions landing within one frame repaint together
+
+# Candidate "| Title | ... |" rows, matched directly on the mapped bytes of a .md file
+_TITLE_ROW_CANDIDATE_RE = re.compile(rb'^[ \t]*\|[ \t]*title[ \t]*\|[^\r\n]*', re.IGNORECASE | re.MULTILINE)
+
 class DescProxyModel(QSortFilterProxyModel):
+    desc_ready = pyqtSignal(str, object, str)  # path key, stamp (None → path gone), title; from the reader thread
+
     def __init__(self, parent=None, root_path: Path | None = None):
         super().__init__(parent)
         self._filter_text = ""
@@ -541,8 +1350,35 @@ class DescProxyModel(QSortFilterProxyModel):
         self._root = (Path(root_path).resolve()
                       if root_path is not None
                       else Path(__file__).resolve().parent)
-
-        self._desc_cache = {}
+        # Root as given and as resolved, normcased with a trailing separator: lets the fence
+        # accept ordinary rows by string prefix instead of resolve() (one lstat per path part)
+        roots = {self._root} | ({Path(root_path).absolute()} if root_path is not None else set())
+        self._root_prefixes = tuple(os.path.join(os.path.normcase(str(r)), "") for r in roots)
+
+        # str(path) → (mtime_ns of the title source, title); least recently used first
+        self._desc_cache: OrderedDict[str, tuple[int, str]] = OrderedDict()
+        # Title sources (.md file / folder meta JSON) of cached rows are watched so an
+        # external edit repaints their Description: cache key → watched path, and back
+        self._watched: dict[str, str] = {}
+        self._watch_owner: dict[str, str] = {}
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_watched_file_changed)
+        # Paint never touches the disk: misses are read by one background thread
+        self._desc_q: "queue.Queue[str]" = queue.Queue(maxsize=_DESC_QUEUE_MAX)
+        self._desc_inflight: set[str] = set()
+        self.desc_ready.connect(self._on_desc_ready)
+        threading.Thread(target=self._desc_reader_loop, daemon=True).start()
+        # Rows whose Description arrived; flushed as one dataChanged span per folder
+        self._desc_changed: set[str] = set()
+        self._desc_repaint_timer = QTimer(self)
+        self._desc_repaint_timer.setSingleShot(True)
+        self._desc_repaint_timer.setInterval(_DESC_REPAINT_MS)
+        self._desc_repaint_timer.timeout.connect(self._flush_desc_changed)
+        self._sm_ref = None  # source model, cached for filterAcceptsRow (reset by setSourceModel)
+
+    def setSourceModel(self, model):
+        self._sm_ref = model
+        super().setSourceModel(model)
 
     def _inside_root_path(self, p: Path) -> bool:
         try:
@@ -551,6 +1387,19 @@ class DescProxyModel(QSortFilterProxyModel):
         except Exception:
             return False
 
+    def _source_inside_root(self, sm, sidx) -> bool:
+        """
+        Fence for a source row. A non-symlink whose path lies under the root is inside
+        (QFileSystemModel already knows isSymLink; no disk access). Symlinks and rows
+        outside the prefix (e.g. the root's ancestors) take the resolve() check.
+        """
+        fp = sm.filePath(sidx)
+        if not sm.fileInfo(sidx).isSymLink():
+            n = os.path.join(os.path.normcase(os.path.normpath(fp)), "")
+            if n.startswith(self._root_prefixes):
+                return True
+        return self._inside_root_path(Path(fp))
+
     # ---- search text API ----
     def setFilterText(self, text: str):
         t = (text or "").strip().lower()
@@ -567,36 +1416,13 @@ class DescProxyModel(QSortFilterProxyModel):
         """
         sm = self.sourceModel()
 
-        # Resolve the filesystem path for the row
-        try:
-            spath = Path(sm.filePath(sidx)).resolve()
-        except Exception:
-            return ""
-
-        # Determine the hard root (prefer a root passed to the proxy; fall back to script dir)
-        try:
-            root = getattr(self, "_root", None)
-            if root is None:
-                root = Path(__file__).resolve().parent
-            root = Path(root).resolve()
-        except Exception:
-            return ""
-
         # Fence: skip anything outside the root (including symlinks that point out)
         try:
-            spath.relative_to(root)
-        except ValueError:
-            return ""
-
-        # Normal behavior (unchanged)
-        try:
-            if spath.is_dir():
-                return self._read_folder_title(spath) or ""
-            name = spath.name.lower()
-            if name.endswith(".md"):
-                return self._read_title_from_md(spath) or ""
-            # PDFs show as read-only; description isn't needed for search
-            return ""
+            if not self._source_inside_root(sm, sidx):
+                return ""
+            # PDFs show as read-only; description isn't needed for search.
+            # Same key as data(), so search and paint share cache entries.
+            return self._cached_desc(str(Path(sm.filePath(sidx))))
         except Exception:
             return ""
 
@@ -634,11 +1460,10 @@ class DescProxyModel(QSortFilterProxyModel):
 
             # Fence: skip anything outside root (incl. symlinks that resolve out)
             try:
-                cpath = Path(sm.filePath(child)).resolve()
+                if not self._source_inside_root(sm, child):
+                    continue
             except Exception:
                 continue
-            if not self._inside_root_path(cpath):
-                continue
 
             if self._row_matches_filter(child):
                 return True
@@ -652,22 +1477,22 @@ class DescProxyModel(QSortFilterProxyModel):
         return False
 
     def filterAcceptsRow(self, source_row, source_parent):
-        sm = self.sourceModel()
+        sm = self._sm_ref
+        if sm is None:
+            sm = self._sm_ref = self.sourceModel()
         sidx = sm.index(source_row, 0, source_parent)
         if not sidx.isValid():
             return False
 
         # Fence: only inside the canonical root
         try:
-            spath = Path(sm.filePath(sidx)).resolve()
+            if not self._source_inside_root(sm, sidx):
+                return False
         except Exception:
             return False
-        if not self._inside_root_path(spath):
-            return False
 
         is_dir = sm.isDir(sidx)
-        name = sm.fileName(sidx).lower()
-        is_md_or_pdf = (name.endswith(".md") or name.endswith(".pdf"))
+        is_md_or_pdf = sm.fileName(sidx).endswith(_MD_PDF_SUFFIXES)  # no lower() copy
 
         # No filter → show all dirs; only .md/.pdf files
         if not self._filter_text:
@@ -688,8 +1513,7 @@ class DescProxyModel(QSortFilterProxyModel):
             return base | Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled
 
         # Files:
-        name = sm.fileName(sidx).lower()
-        if name.endswith(".pdf"):
+        if sm.fileName(sidx).endswith(_PDF_SUFFIXES):
             # Read-only: no drag, no drop
             return base & ~(Qt.ItemIsDragEnabled | Qt.ItemIsDropEnabled)
         # .md files can be dragged (to move) but not dropped-onto
@@ -723,19 +1547,18 @@ class DescProxyModel(QSortFilterProxyModel):
         if index.column() == 0:
             return super().data(index, role)
         if index.column() == 1 and role in (Qt.DisplayRole, Qt.ToolTipRole):
+            sm = self.sourceModel()
             sidx = self.mapToSource(index.sibling(index.row(), 0))
-            spath = Path(self.sourceModel().filePath(sidx))
-            key = str(spath)
-            cached = self._desc_cache.get(key)
-            if cached is None:
-                if spath.is_dir():
-                    cached = self._read_folder_title(spath)
-                elif spath.is_file() and spath.suffix.lower() == ".md":
-                    cached = self._read_title_from_md(spath)
-                else:
-                    cached = ""
-                self._desc_cache[key] = cached
-            return cached
+            key = str(Path(sm.filePath(sidx)))
+            hit = self._desc_cache.get(key)
+            if hit is not None:
+                self._desc_cache.move_to_end(key)
+                return hit[1]
+            # isDir() is answered from the model's own cache (no stat)
+            if not (sm.isDir(sidx) or key.endswith(_MD_SUFFIXES)):
+                return ""  # PDFs have no Description
+            self._queue_desc(key)
+            return _DESC_PENDING
         if index.column() >= 2 and role == Qt.DisplayRole:
             return ""
         return super().data(index, role)
@@ -745,36 +1568,169 @@ class DescProxyModel(QSortFilterProxyModel):
             return ["Name", "Description"][section] if section in (0, 1) else super().headerData(section, orientation, role)
         return super().headerData(section, orientation, role)
 
+    def _desc_stamp(self, key: str):
+        """
+        (stamp, reader) for the title source of `key` — the .md file itself, or the
+        folder's meta JSON (-1 if absent) — or None if the path has no Description.
+        """
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        if stat.S_ISDIR(st.st_mode):
+            try:
+                stamp = os.stat(folder_meta_path(Path(key))).st_mtime_ns
+            except OSError:
+                stamp = -1
+            return stamp, self._read_folder_title
+        if stat.S_ISREG(st.st_mode) and key.endswith(_MD_SUFFIXES):
+            return st.st_mtime_ns, self._read_title_from_md
+        return None
+
+    def _cached_desc(self, key: str) -> str:
+        """
+        Synchronous Description (search filter): re-read only when its source changed.
+        One stat() per hit.
+        """
+        src = self._desc_stamp(key)
+        if src is None:
+            return ""
+        stamp, reader = src
+        hit = self._desc_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            self._desc_cache.move_to_end(key)
+            return hit[1]
+        title = reader(Path(key)) or ""
+        self._store_desc(key, stamp, title)
+        return title
+
+    def _store_desc(self, key: str, stamp: int, title: str):
+        cache = self._desc_cache
+        cache[key] = (stamp, title)
+        cache.move_to_end(key)
+        while len(cache) > _DESC_CACHE_MAX:
+            old, _ = cache.popitem(last=False)
+            self._unwatch(old)
+        if key not in self._watched:
+            if key.endswith(_MD_SUFFIXES):
+                self._watch(key, key)
+            elif stamp != -1:
+                self._watch(key, str(folder_meta_path(Path(key))))
+
+    # ---- background Description reads ----
+    def _queue_desc(self, key: str):
+        if key in self._desc_inflight:
+            return
+        try:
+            self._desc_q.put_nowait(key)
+        except queue.Full:
+            return  # a later paint asks again
+        self._desc_inflight.add(key)
+
+    def _desc_reader_loop(self):
+        while True:
+            key = self._desc_q.get()
+            stamp = None
+            try:
+                src = self._desc_stamp(key)
+                if src is not None:
+                    stamp, reader = src
+                    title = reader(Path(key)) or ""
+                else:
+                    title = ""
+            except Exception:
+                # Still answer, or the key stays in _desc_inflight and the row shows "…" for good;
+                # with a stamp the blank title is cached until the file changes (no retry per paint)
+                title = ""
+            self.desc_ready.emit(key, stamp, title)
+
+    def _on_desc_ready(self, key: str, stamp, title: str):
+        self._desc_inflight.discard(key)
+        if stamp is None:
+            self._desc_cache.pop(key, None)
+            self._unwatch(key)
+            return
+        hit = self._desc_cache.get(key)
+        self._store_desc(key, stamp, title)
+        if hit is None or hit[1] != title:
+            self._desc_changed.add(key)
+            if not self._desc_repaint_timer.isActive():
+                self._desc_repaint_timer.start()
+
+    def _flush_desc_changed(self):
+        """One dataChanged per parent folder, spanning the first..last updated row."""
+        keys, self._desc_changed = self._desc_changed, set()
+        sm = self.sourceModel()
+        spans: dict[str, list] = {}  # parent folder path → [parent proxy index, first row, last row]
+        for key in keys:
+            sidx = sm.index(key)
+            if not sidx.isValid():
+                continue
+            pidx = self.mapFromSource(sidx)
+            if not pidx.isValid():
+                continue
+            row = pidx.row()
+            span = spans.get(sm.filePath(sidx.parent()))
+            if span is None:
+                spans[sm.filePath(sidx.parent())] = [pidx.parent(), row, row]
+            else:
+                span[1] = min(span[1], row)
+                span[2] = max(span[2], row)
+        for parent, first, last in spans.values():
+            self.dataChanged.emit(self.index(first, 1, parent), self.index(last, 1, parent),
+                                  [Qt.DisplayRole, Qt.ToolTipRole])
+
+    # ---- change watching ----
+    def _watch(self, key: str, path: str):
+        if self._watcher.addPath(path):
+            self._watched[key] = path
+            self._watch_owner[path] = key
+
+    def _unwatch(self, key: str):
+        path = self._watched.pop(key, None)
+        if path is not None:
+            self._watch_owner.pop(path, None)
+            self._watcher.removePath(path)
+
+    def _on_watched_file_changed(self, p: str):
+        # Editors that save via rename drop the watch; it is re-added when the title is stored
+        key = self._watch_owner.get(p, p)
+        self._unwatch(key)
+        self.refresh_desc(Path(key))
+
     def _read_title_from_md(self, path: Path) -> str:
+        """Value of the first '| Title | ... |' row; scans the mapped file instead of reading it all."""
         try:
-            text = path.read_text(encoding="utf-8", errors="ignore")
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ""  # mmap cannot map an empty file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for m in _TITLE_ROW_CANDIDATE_RE.finditer(mm):
+                        line = m.group(0).decode("utf-8", errors="ignore").strip()
+                        parts = [p.strip() for p in line.strip("|").split("|")]
+                        if len(parts) >= 2 and parts[0].lower() == "title":
+                            return parts[1]
         except Exception:
             return ""
-        for line in text.splitlines():
-            s = line.strip()
-            if not s.startswith("|"):
-                continue
-            parts = [p.strip() for p in s.strip("|").split("|")]
-            if len(parts) >= 2 and parts[0].lower() == "title":
-                return parts[1]
         return ""
 
     def _read_folder_title(self, folder: Path) -> str:
         try:
-            meta_p = folder_meta_path(folder)
-            if not meta_p.exists():
-                return ""
-            with meta_p.open("r", encoding="utf-8") as f:
-                meta = json.load(f)
+            meta = json_loads_bytes(folder_meta_path(folder).read_bytes())  # missing → except
             return meta.get("TITLE") or meta.get("title") or meta.get("description", "")
         except Exception:
             return ""
 
     def refresh_desc(self, path: Path):
         key = str(path)
-        self._desc_cache.pop(key, None)
+        if key in self._desc_cache:
+            self._queue_desc(key)  # keeps showing the old title until the re-read lands
+        else:
+            self._emit_desc_changed(key)
+
+    def _emit_desc_changed(self, key: str):
         sm = self.sourceModel()
-        sidx = sm.index(str(path))
+        sidx = sm.index(key)
         if sidx.isValid():
             pidx = self.mapFromSource(sidx)
             if pidx.isValid():
@@ -824,7 +1780,77 @@ class SlimLineEditDelegate(QStyledItemDelegate):
         )
         return editor
 
+# ---------- Table model --------------------------------------------------------
+class StringTableModel(QAbstractTableModel):
+    """
+    Editable grid of strings for a QTableView (Revision History, Variant Details).
+    Rows are plain lists padded to the column count; a file load swaps them all in
+    with one model reset instead of one item per cell.
+    """
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows: list[list[str]] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        value = "" if value is None else str(value)
+        row = self._rows[index.row()]
+        if row[index.column()] == value:
+            return False
+        row[index.column()] = value
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        f = super().flags(index)
+        return f | Qt.ItemIsEditable if index.isValid() else f
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def rows(self) -> list:
+        """The live row lists (read them, don't mutate them)."""
+        return self._rows
+
+    def set_rows(self, rows):
+        """Replace every row (padded/truncated to the column count) in one reset."""
+        n = len(self._headers)
+        self.beginResetModel()
+        self._rows = [(list(r) + [""] * n)[:n] for r in rows]
+        self.endResetModel()
+
+    def append_row(self, values=()):
+        n = len(self._headers)
+        r = len(self._rows)
+        self.beginInsertRows(QModelIndex(), r, r)
+        self._rows.append((list(values) + [""] * n)[:n])
+        self.endInsertRows()
+
+    def remove_row(self, r: int):
+        if 0 <= r < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), r, r)
+            del self._rows[r]
+            self.endRemoveRows()
+
 # ---------- Settings & Tools Dialog -------------------------------------------
+# Settings whose change warrants ensure_git_repo + pull when the dialog is accepted
+_SETTINGS_GIT_KEYS = {"git_remote_url", "git_branch", "git_mode", "git_enabled"}
+
 class SettingsToolsDialog(QDialog):
     def __init__(self, parent, settings: dict, do_save_cb, do_archive_cb, do_export_cb):
         super().__init__(parent)
@@ -981,50 +2007,164 @@ class SettingsToolsDialog(QDialog):
         return out
 
 # ---------- Background Git queue (non-blocking) -------------------------------
+class _UiInvoker(QObject):
+    """Runs callables on the GUI thread. post(fn) is safe from any thread (queued signal)."""
+    _call = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._call.connect(self._run, Qt.QueuedConnection)
+
+    def _run(self, fn):
+        try:
+            fn()
+        except Exception as e:
+            _dbg(f"UI post exception → {e!r}")
+
+    def post(self, fn: callable):
+        self._call.emit(fn)
+
 class _GitBg:
-    """Serializes Git tasks off the UI thread."""
+    """Serializes Git tasks off the UI thread.
+
+    Jobs submitted with a tag coalesce: while a job with that tag is still
+    queued, further submits with the same tag are dropped.
+    """
     def __init__(self, repo_root: Path, ui_post: callable):
         self.repo_root = repo_root
-        self._q: "queue.Queue[callable]" = queue.Queue()
+        self._q: "queue.Queue[tuple[str | None, callable] | None]" = queue.Queue()
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
         self._ui_post = ui_post
-        t = threading.Thread(target=self._loop, daemon=True)
-        t.start()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
 
     def _loop(self):
         while True:
-            fn = self._q.get()
+            item = self._q.get()
             try:
+                if item is None:
+                    return  # shutdown sentinel: everything queued before it has run
+                tag, fn = item
+                if tag is not None:
+                    with self._lock:
+                        self._pending.discard(tag)
                 fn()
             except Exception:
                 pass
             finally:
                 self._q.task_done()
 
-    def submit(self, fn: callable):
-        self._q.put(fn)
+    def submit(self, fn: callable, tag: str | None = None):
+        if self._stop.is_set():
+            return
+        if tag is not None:
+            with self._lock:
+                if tag in self._pending:
+                    return
+                self._pending.add(tag)
+        self._q.put((tag, fn))
 
     # helpers to marshal UI updates safely
     def ui(self, fn: callable):
         self._ui_post(fn)
 
+    def shutdown(self, timeout: float = 2.0):
+        """Refuse new jobs, run the ones already queued, then stop (waits at most `timeout`)."""
+        self._stop.set()
+        self._q.put(None)
+        self._thread.join(timeout)
+
+class _MdWriter:
+    """Writes Markdown files on one background thread, in submit order.
+
+    A path submitted again before its write starts is written once, with the newest text.
+    pending(path) is the text queued or being written for path (what the file is about to hold).
+    on_done(err) runs on the writer thread (err is None on success); superseded ones are dropped.
+    """
+    def __init__(self):
+        self._q: "queue.Queue[str | None]" = queue.Queue()
+        self._jobs: dict[str, tuple[Path, str, callable]] = {}  # waiting to be written
+        self._latest: dict[str, str] = {}                      # queued or in flight
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            key = self._q.get()
+            if key is None:
+                self._q.task_done()
+                return
+            try:
+                with self._lock:
+                    path, text, on_done = self._jobs.pop(key)
+                err = None
+                try:
+                    write_md_text(path, text)
+                except Exception as e:
+                    err = e
+                with self._lock:
+                    if self._latest.get(key) is text:
+                        del self._latest[key]
+                on_done(err)
+            except Exception:
+                pass
+            finally:
+                self._q.task_done()
+
+    def submit(self, path: Path, text: str, on_done: callable):
+        key = os.fspath(path)
+        with self._lock:
+            queued = key in self._jobs
+            self._jobs[key] = (path, text, on_done)
+            self._latest[key] = text
+        if not queued:
+            self._q.put(key)
+
+    def pending(self, path: Path) -> Optional[str]:
+        with self._lock:
+            return self._latest.get(os.fspath(path))
+
+    def flush(self):
+        """Block until every queued write has finished (call before renaming/deleting files)."""
+        self._q.join()
+
+    def close(self, timeout: float = 10.0):
+        """Finish every queued write, then stop."""
+        self._q.put(None)
+        self._thread.join(timeout)
+
 # ---------- Debug logging (thread-safe) ---------------------------------------
 def _ts():
     import datetime as _dt
     return _dt.datetime.now().strftime("%H:%M:%S")
 
+_LOG_BUFFER_LINES = 5000   # newest lines kept while the console is hidden or behind
+_LOG_DRAIN_MS = 50         # console refresh period
+_LOG_DRAIN_MAX = 500       # lines appended per refresh
+
 class _UILogger:
-    """Append debug lines into a QPlainTextEdit from any thread."""
-    def __init__(self, post_to_ui_callable, append_fn_callable):
-        self._post = post_to_ui_callable
-        self._append = append_fn_callable
+    """
+    Collect debug lines from any thread; the UI thread drains them in batches.
+    log() is a bounded deque append (thread-safe, no per-line event posted to Qt).
+    """
+    def __init__(self):
+        self._buf: deque = deque(maxlen=_LOG_BUFFER_LINES)
 
     def log(self, msg: str):
-        line = f"[{_ts()}] {msg}"
+        self._buf.append(f"[{_ts()}] {msg}")
+
+    def drain(self, limit: int = _LOG_DRAIN_MAX) -> list[str]:
+        buf = self._buf
+        out = []
         try:
-            # Marshal to UI thread
-            self._post(lambda: self._append(line))
-        except Exception:
+            for _ in range(min(limit, len(buf))):
+                out.append(buf.popleft())
+        except IndexError:
             pass
+        return out
 
 # Global debug hook used by git helpers (safe no-op if unset)
 _DBG_HOOK = None
@@ -1045,7 +2185,22 @@ def _clip(s: str, limit: int = 600) -> str:
     s = (s or "")
     return (s if len(s) <= limit else s[:limit] + " …(trunc)")
 
+@lru_cache(maxsize=64)
+def _schematic_name_re(pn: str) -> "re.Pattern":
+    """Matches '<pn>_<label>.pdf' and captures the label; the PN prefix is case-insensitive only on Windows."""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(rf"{re.escape(pn)}_(.*)(?i:\.pdf)\Z", flags | re.DOTALL)
+
 # ---------- Main Window --------------------------------------------------------
+_DIRTY_TITLE_DEBOUNCE_MS = 150  # delay before the first edit marks tabs/title dirty
+_PN_RESCAN_DEBOUNCE_MS = 300    # Part Number typing pause before rescanning schematic PDFs
+_ASYNC_LOAD_MIN_BYTES = 256 * 1024  # .md files at least this big are parsed off the UI thread
+_DIRTY_TAB_FMT = "● {}"                # current tab title while there are unsaved edits
+_DIRTY_WINDOW_TITLE = APP_TITLE + " •"
+_FILE_COUNTER_DEBOUNCE_MS = 500    # directoryLoaded bursts coalesce into one file count
+_MD_TOTAL_BUDGET_S = 3.0           # wall-clock cap for the background repo-wide .md count
+_SETTINGS_FLUSH_MS = 1000          # counter/stats updates within this window share one settings write
+
 class CatalogWindow(QMainWindow):
     def __init__(self, catalog_root: Path, app_icon: QIcon):
         super().__init__()
@@ -1064,7 +2219,11 @@ class CatalogWindow(QMainWindow):
 
         self._md_total_cached: int | None = None
         self._md_total_cached_when: float = 0.0  # monotonic seconds
-        self._md_total_min_interval_s: float = 8.0
+        # Our own creates/renames/deletes/imports/syncs mark the total stale; the interval
+        # only catches changes made outside the app
+        self._md_total_min_interval_s: float = 60.0
+        self._md_total_stale = True
+        self._md_total_inflight = False  # a background recount is running
 
         # Review tab dirty flag
         self.review_dirty = False
@@ -1073,12 +2232,32 @@ class CatalogWindow(QMainWindow):
         self.autosave_interval_ms = 30000  # 30s
         self.autosave_interval_s = self.autosave_interval_ms // 1000
         self.autosave_remaining_s = self.autosave_interval_s
-
-        self.base_tab_titles = []
+        # First edit repaints titles/labels once, shortly after the keystroke (not inside it)
+        self._dirty_title_timer = QTimer(self)
+        self._dirty_title_timer.setSingleShot(True)
+        self._dirty_title_timer.setInterval(_DIRTY_TITLE_DEBOUNCE_MS)
+        self._dirty_title_timer.timeout.connect(self._on_first_dirty)
+        # Part Number edits rescan schematic PDFs once typing pauses
+        self._pn_rescan_timer = QTimer(self)
+        self._pn_rescan_timer.setSingleShot(True)
+        self._pn_rescan_timer.setInterval(_PN_RESCAN_DEBOUNCE_MS)
+        self._pn_rescan_timer.timeout.connect(self._schedule_schematic_rescan)
+        # Counter and stats updates only mark settings dirty; this writes them once things settle
+        self._settings_dirty = False
+        self._settings_flush_timer = QTimer(self)
+        self._settings_flush_timer.setSingleShot(True)
+        self._settings_flush_timer.setInterval(_SETTINGS_FLUSH_MS)
+        self._settings_flush_timer.timeout.connect(self._flush_settings)
+
+        self.base_tab_titles: tuple[str, ...] = ()
+        self._dirty_indicator_state: Optional[tuple[bool, int]] = None  # (dirty, current tab) last shown
+        self._load_gen = 0  # bumped per file load; stale background parses are dropped
 
         # Text zoom state
         self._base_font_pt = 12
         self._zoom_steps = 0  # relative to base
+        self._mono_fonts: dict[int, QFont] = {}      # point size → monospace font
+        self._mono_pt_applied: Optional[int] = None  # size currently set on the editors
 
         # Toolbar
         tb = QToolBar("Main", self)
@@ -1134,9 +2313,35 @@ class CatalogWindow(QMainWindow):
         self.autosave_label.setStyleSheet("color:#A0A6AD; padding: 0 6px;")
         tb.addWidget(self.autosave_label)
 
-        # Post-to-UI helper (uses Qt event loop)
-        self._ui_post = lambda fn: QTimer.singleShot(0, fn)
+        # Post-to-UI helper (queued signal → runs on the GUI thread, callable from worker threads)
+        self._ui_invoker = _UiInvoker(self)
+        self._ui_post = self._ui_invoker.post
         self._gitbg = _GitBg(self.catalog_root, self._ui_post)
+        self._md_writer = _MdWriter()  # .md saves are written off the UI thread
+        # One-off background jobs (export, archive, repo .md count, large-file parse)
+        self._workers = ThreadPoolExecutor(max_workers=4, thread_name_prefix="catalog-job")
+        self._file_jobs: set = set()  # export/archive futures still writing; closeEvent waits for them
+        self._git_catfile: Optional["_GitCatFile"] = None  # started on first object query
+
+        # Footer sync state is computed on the Git thread; UI shows the last known value
+        self._md_counts_text = "Files in folder: 0 | Total: 0"
+        self._md_in_folder = 0
+        self._sync_state_label = "Sync: …"
+        self._sync_state_pending = False
+        # Per-file line counts for repo stats: path → (mtime_ns, size, lines); Git thread only
+        self._line_counts: Optional[dict[str, tuple[int, int, int]]] = None  # loaded from STATS_CACHE_PATH on first use
+        self._stats_totals: Optional[tuple[int, int]] = None  # (md files, lines) from the last stats pass
+        self._stats_full_at = 0.0  # monotonic time of the last full compute_repo_stats walk
+        self._stats_pending: dict[str, str] = {}  # saved path → save time, waiting for the stats job
+        self._stats_lock = threading.Lock()
+        # (schematic folder, PN, folder mtime_ns) → scanned (label, pdf) items
+        self._schematic_scan_cache: dict[tuple, tuple] = {}
+        # Saves waiting for the next batched commit: str(path) → (path, commit message)
+        self._commit_batch: dict[str, tuple[Path, str]] = {}
+        self._commit_batch_timer = QTimer(self)
+        self._commit_batch_timer.setSingleShot(True)
+        self._commit_batch_timer.setInterval(GIT_COMMIT_COALESCE_MS)
+        self._commit_batch_timer.timeout.connect(self._flush_commit_batch)
 
         # Push countdown state + label
         self.git_push_delay_s = int(self.settings.get("auto_push_delay_seconds", 60))
@@ -1155,13 +2360,22 @@ class CatalogWindow(QMainWindow):
 
         # File system model / proxy
         self.fs_model = QFileSystemModel(self)
+        # Generic folder icon: skips per-folder icon extraction (desktop.ini etc.) on cold open.
+        # Change watching stays on: new/renamed files are written straight to disk, and the
+        # model's own directory watcher is what makes them appear in the tree.
+        self.fs_model.setOption(QFileSystemModel.DontUseCustomDirectoryIcons, True)
         self.fs_model.setReadOnly(False)
         self.fs_model.setRootPath(str(self.catalog_root))
         self.fs_model.setNameFilters(["*.md", "*.pdf"])
         self.fs_model.setNameFilterDisables(False)
         self.fs_model.fileRenamed.connect(self.on_fs_file_renamed)
+        # A tree expansion loads many directories in a row: count once after they settle
+        self._file_counter_timer = QTimer(self)
+        self._file_counter_timer.setSingleShot(True)
+        self._file_counter_timer.setInterval(_FILE_COUNTER_DEBOUNCE_MS)
+        self._file_counter_timer.timeout.connect(self.update_file_counter)
         try:
-            self.fs_model.directoryLoaded.connect(lambda _: self.update_file_counter())
+            self.fs_model.directoryLoaded.connect(lambda _: self._file_counter_timer.start())
         except Exception:
             pass
 
@@ -1240,13 +2454,13 @@ class CatalogWindow(QMainWindow):
         self.debug_console.setVisible(bool(self.settings.get("show_debug_console", True)))
         self.debug_console.setFixedHeight(140)
 
-        def _append_debug_line(s: str):
-            self.debug_console.appendPlainText(s)
-
-        # Post-to-UI helper for logger (uses singleShot)
-        self._ui_post_for_log = lambda fn: QTimer.singleShot(0, fn)
-        self._logger = _UILogger(self._ui_post_for_log, _append_debug_line)
+        # Git helpers log from worker threads; lines are buffered and appended in batches
+        self._logger = _UILogger()
         set_global_debug_logger(self.debug)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(_LOG_DRAIN_MS)
+        self._log_timer.timeout.connect(self._drain_debug_log)
+        self._log_timer.start()
 
         # Add console under the tree
         left_v.addWidget(self.debug_console, 0)
@@ -1340,16 +2554,23 @@ class CatalogWindow(QMainWindow):
         self.fields_group = QGroupBox("Introduction", intro_tab)
         self.fields_form = QFormLayout(self.fields_group)
         self.field_widgets: dict[str, QLineEdit] = {}
-        for label, placeholder in FIELD_ORDER:
-            le = QLineEdit(self.fields_group); le.setPlaceholderText(placeholder)
-            self.field_widgets[label] = le
-            self.fields_form.addRow(label + ":", le)
+        self.fields_group.setUpdatesEnabled(False)
+        try:
+            for label, placeholder in FIELD_ORDER:
+                le = QLineEdit(self.fields_group)
+                if placeholder:
+                    le.setPlaceholderText(placeholder)
+                self.field_widgets[label] = le
+                self.fields_form.addRow(label + ":", le)
+        finally:
+            self.fields_group.setUpdatesEnabled(True)
         intro_v.addWidget(self.fields_group)
         self.meta_inner.addTab(intro_tab, "Introduction")
 
         rev_tab = QWidget(self); rev_v = QVBoxLayout(rev_tab)
-        self.rev_table = QTableWidget(0, len(REV_HEADERS), rev_tab)
-        self.rev_table.setHorizontalHeaderLabels(REV_HEADERS)
+        self.rev_model = StringTableModel(REV_HEADERS, self)
+        self.rev_table = QTableView(rev_tab)
+        self.rev_table.setModel(self.rev_model)
         for c, h in enumerate(REV_HEADERS):
             mode = QHeaderView.Stretch if h == "Description" else QHeaderView.ResizeToContents
             self.rev_table.horizontalHeader().setSectionResizeMode(c, mode)
@@ -1364,8 +2585,9 @@ class CatalogWindow(QMainWindow):
         self.meta_inner.addTab(rev_tab, "Revision History")
 
         var_tab = QWidget(self); var_v = QVBoxLayout(var_tab)
-        self.variant_table = QTableWidget(0, 1, var_tab)
-        self.variant_table.setHorizontalHeaderLabels(VARIANT_HEADERS)
+        self.variant_model = StringTableModel(VARIANT_HEADERS, self)
+        self.variant_table = QTableView(var_tab)
+        self.variant_table.setModel(self.variant_model)
         self.variant_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.variant_table.verticalHeader().setVisible(False)
         var_buttons = QHBoxLayout()
@@ -1397,8 +2619,7 @@ class CatalogWindow(QMainWindow):
         pl_tab = QWidget(self); pl_v = QVBoxLayout(pl_tab)
         self.partlist_edit = QPlainTextEdit(pl_tab)
         self.partlist_edit.setPlaceholderText(
-            "(paste or type your partlist table here)\n"
-            f"| {' | '.join(PARTLIST_HEADERS)} |\n{_divider_for(PARTLIST_HEADERS)}"
+            "(paste or type your partlist table here)\n" + _PARTLIST_EMPTY_TABLE
         )
         pl_v.addWidget(self.partlist_edit); self.tabs.addTab(pl_tab, "Partlist")
 
@@ -1414,18 +2635,27 @@ class CatalogWindow(QMainWindow):
         review_tab = QWidget(self); review_v = QVBoxLayout(review_tab)
         self.review_edit = QPlainTextEdit(review_tab)
         self.review_edit.setPlaceholderText("Raw Markdown view. Edits here will be saved verbatim.")
-        self.review_edit.textChanged.connect(self._on_review_changed)
         review_v.addWidget(self.review_edit); self.tabs.addTab(review_tab, "Review")
+        self._review_tab = review_tab
+        # Raw text waiting for the Review tab to be shown (None = editor is current)
+        self._review_pending_text: Optional[str] = None
+        # Schematic subtabs are stale and get rescanned when Documents is next shown
+        self._schematic_tabs_dirty = False
+        # (path, text) the clean form currently mirrors; lets load_file skip re-parsing it
+        self._form_source: Optional[tuple[Path, str]] = None
 
         right_layout.addWidget(self.tabs, 1)
 
         # After building tabs: set base titles, wire dirty + countdown autosave
-        self.base_tab_titles = [self.tabs.tabText(i) for i in range(self.tabs.count())]
+        self.base_tab_titles = tuple(self.tabs.tabText(i) for i in range(self.tabs.count()))
         self.tabs.currentChanged.connect(self.update_dirty_indicator)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
+        # One 1 Hz tick drives both countdowns; it stops itself while neither is running
         self.countdown_timer = QTimer(self)
+        self.countdown_timer.setInterval(1000)
         self.countdown_timer.timeout.connect(self._tick_autosave_countdown)
-        self.countdown_timer.start(1000)
+        self.countdown_timer.start()
 
         # --- Footer sync poller (every 60s) ---
         self._sync_poll_timer = QTimer(self)
@@ -1450,12 +2680,11 @@ class CatalogWindow(QMainWindow):
         # --- Git: init quickly, then pull in background ---
         mode = git_mode_from_settings(self.settings)
         if self.settings.get("git_enabled", True) and mode == GitMode.FULL:
-            try:
-                ensure_git_repo(self.catalog_root, self.settings)
-            except Exception:
-                pass
-
             def _bg_pull():
+                try:
+                    ensure_git_repo(self.catalog_root, self.settings)
+                except Exception:
+                    pass
                 try:
                     br = (self.settings.get("git_branch") or "main")
                     self.debug(f"Pull: start ({br}) @ {datetime.datetime.now().isoformat(timespec='seconds')}")
@@ -1466,7 +2695,7 @@ class CatalogWindow(QMainWindow):
                     self.debug(f"Pull: FAIL → {ex}")
                     self._gitbg.ui(lambda: None)
 
-            self._gitbg.submit(_bg_pull)
+            self._gitbg.submit(_bg_pull, tag="pull")
         else:
             self.debug(f"Git: startup pull skipped (git_mode={mode.name})")
             self.push_label.setText("Sync push in: —")
@@ -1474,10 +2703,13 @@ class CatalogWindow(QMainWindow):
         
     # ---------- Zoom helpers ----------------------------------------------------
     def _mono_font(self, pt: int) -> QFont:
-        f = QFont()
-        f.setStyleHint(QFont.Monospace)
-        f.setFamily("Consolas" if platform.system() == "Windows" else "Monospace")
-        f.setFixedPitch(True); f.setPointSize(pt)
+        f = self._mono_fonts.get(pt)
+        if f is None:
+            f = QFont()
+            f.setStyleHint(QFont.Monospace)
+            f.setFamily("Consolas" if platform.system() == "Windows" else "Monospace")
+            f.setFixedPitch(True); f.setPointSize(pt)
+            self._mono_fonts[pt] = f
         return f
 
     def _all_plain_editors(self) -> list:
@@ -1485,9 +2717,14 @@ class CatalogWindow(QMainWindow):
 
     def apply_monospace_font(self):
         pt = max(6, self._base_font_pt + self._zoom_steps)
+        # Each setFont re-lays out the editor's whole document; skip when the size didn't
+        # change (zoom clamped at its limits, reset at 0, repeated shortcut)
+        if pt == self._mono_pt_applied:
+            return
         f = self._mono_font(pt)
         for ed in self._all_plain_editors():
             ed.setFont(f)
+        self._mono_pt_applied = pt
 
     def adjust_zoom(self, delta_steps: int):
         self._zoom_steps = max(-6, min(18, self._zoom_steps + delta_steps))
@@ -1507,29 +2744,30 @@ class CatalogWindow(QMainWindow):
             do_export_cb=self.export_single_file_dialog_cb  # now only filename
         )
         if dlg.exec_() == QDialog.Accepted:
+            old = self.settings
             self.settings = dlg.result_settings()
+            changed = {k for k, v in self.settings.items() if old.get(k) != v}
             save_settings(self.settings)
             self.refresh_git_mode_label()
             if self.settings.get("git_enabled", True):
-                try:
-                    ensure_git_repo(self.catalog_root, self.settings)
+                # Only a remote/branch/mode change can make a fresh pull worthwhile
+                if changed & _SETTINGS_GIT_KEYS:
                     def _bg_pull():
                         try:
+                            ensure_git_repo(self.catalog_root, self.settings)
                             git_pull(self.catalog_root, (self.settings.get("git_branch") or "main"))
                             self._gitbg.ui(lambda: self.statusBar().showMessage("Pulled latest from origin", 2500))
                         except Exception:
                             self._gitbg.ui(lambda: self.statusBar().showMessage("Pull skipped (no origin/creds).", 4000))
-                    self._gitbg.submit(_bg_pull)
-                except Exception:
-                    pass
+                    self._gitbg.submit(_bg_pull, tag="pull")
             else:
                 # Turn off any pending push countdown and keep label static
                 self.git_push_remaining_s = None
                 self.push_label.setText("Sync push in: —")
 
-            # If a file is open, rebuild schematic subtabs using the new folder
-            if self.current_path and self.current_path.is_file():
-                self._rebuild_schematic_tabs_from_scan()
+            # If a file is open and the schematic folder moved, rebuild its subtabs
+            if "schematic_folder" in changed and self.current_path and self.current_path.is_file():
+                self._schedule_schematic_rescan()
 
 
     # ---------- Schematic (scan folder for PN_*.pdf) ---------------------------
@@ -1560,24 +2798,49 @@ class CatalogWindow(QMainWindow):
             return out
         root = self._resolve_schematic_root(base_dir)
         try:
-            if not root.exists() or not root.is_dir():
-                return out
-            # Strict match on PN_*.pdf
-            for p in sorted(root.glob(f"{pn}_*.pdf")):
-                name = p.name
-                # Expect PN_<label>.pdf
-                label = name[len(pn) + 1 : -4] if name.lower().endswith(".pdf") else name
-                label = label.strip() or "—"
-                out.append((label, p.resolve()))
+            # The folder's mtime changes whenever an entry is added, removed or renamed
+            key = (str(root), pn, os.stat(root).st_mtime_ns)
+        except OSError:
+            return out
+        hit = self._schematic_scan_cache.get(key)
+        if hit is not None:
+            return list(hit)
+        try:
+            # Strict match on PN_*.pdf; one readdir, no per-entry stat for regular files
+            match = _schematic_name_re(pn).match
+            hits = []
+            with os.scandir(root) as it:
+                for e in it:
+                    m = match(e.name)
+                    if m is not None and e.is_file():
+                        hits.append((e.name, m.group(1), e))
+            hits.sort(key=lambda t: t[0])
+            root_r = root.resolve()
+            for name, label, e in hits:
+                out.append((label.strip() or "—", Path(e.path).resolve() if e.is_symlink() else root_r / name))
         except Exception:
             pass
+        if len(self._schematic_scan_cache) >= 256:
+            self._schematic_scan_cache.clear()
+        self._schematic_scan_cache[key] = tuple(out)
         return out
 
+    def _clear_schematic_tabs(self):
+        """Drop every schematic subtab and free its widgets (and any open PDF view)."""
+        tabs = self.schematic_tabs
+        # Each removeTab(0) moves the current index; don't let that load the next PDF in turn
+        tabs.blockSignals(True)
+        try:
+            while tabs.count():
+                w = tabs.widget(0)
+                tabs.removeTab(0)
+                w.deleteLater()  # removeTab() keeps the page alive; a loaded view holds rendered pages
+        finally:
+            tabs.blockSignals(False)
+
     def _build_schematic_tabs_from_items(self, items: list[tuple[str, Path]]):
         """Rebuild schematic subtabs from a list of (label, path). Uses lazy-load."""
-        # Clear old
-        while self.schematic_tabs.count():
-            self.schematic_tabs.removeTab(0)
+        self._clear_schematic_tabs()
 
         if not items:
             msg = QLabel(
@@ -1600,6 +2863,9 @@ class CatalogWindow(QMainWindow):
             holder.setProperty("pdf_path", str(pdf_path))
             holder.setProperty("loaded", False)
             self.schematic_tabs.addTab(holder, label)
+            if _HAS_FITZ:
+                # Warm the PNG cache while the tab is still unopened (single render thread, queued)
+                _pdf_render_pool().submit(_pdf_prewarm_first_page, str(pdf_path))
 
     def _rebuild_schematic_tabs_from_scan(self):
         """Convenience: rebuild schematic tabs for the currently loaded file."""
@@ -1610,75 +2876,107 @@ class CatalogWindow(QMainWindow):
         items = self._scan_schematic_pdfs(pn, base_dir)
         self._build_schematic_tabs_from_items(items)
 
+    def _schedule_schematic_rescan(self):
+        """Rescan now if Documents is showing; otherwise defer the scan until it is opened."""
+        if self.tabs.currentWidget() is self.schematic_tab:
+            self._schematic_tabs_dirty = False
+            self._rebuild_schematic_tabs_from_scan()
+        else:
+            self._schematic_tabs_dirty = True
+
+    def _submit_file_job(self, fn: callable):
+        """Run a job that writes files (export/archive) on the worker pool; closing waits for it."""
+        fut = self._workers.submit(fn)
+        self._file_jobs.add(fut)
+        # The set is only touched on the UI thread
+        fut.add_done_callback(lambda f: self._ui_post(lambda: self._file_jobs.discard(f)))
+
     def export_single_file_dialog_cb(self, out_name: str):
         # Destination is always TOP LEVEL of catalog_root
         out_path = self.catalog_root / (out_name if out_name.lower().endswith(".md") else (out_name + ".md"))
-        try:
-            count, skipped, total_bytes = self._export_concat_markdown(out_path)
-        except Exception as e:
-            self.error("Export Single File", f"Failed to export:\n{e}")
-            return
-        self.info(
-            "Export Single File",
-            f"Created:\n{out_path}\n\nConcatenated {count} file(s) (skipped {skipped}).\nSize: {total_bytes} bytes."
-        )
 
-    def _iter_repo_files(self, root: Path):
-        try:
-            for r, _, files in os.walk(root):
-                base = Path(r)
-                for f in files:
-                    yield base / f
-        except Exception:
-            return
+        def _progress(done: int, total: int):
+            self._ui_post(lambda: self._note(f"Exporting… {done}/{total} file(s)", 2000))
 
-    def _count_repo_lines(self) -> int:
-        """Count lines only in text files, skipping VCS/venv/build dirs and huge files."""
-        text_exts = {
-            ".md", ".txt", ".json", ".py", ".yml", ".yaml", ".ini", ".cfg", ".toml",
-            ".csv", ".bat", ".ps1"
-        }
-        skip_dirs = {
-            ".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".pytest_cache",
-            ".ruff_cache", "node_modules", "build", "dist", ".venv", "venv"
-        }
-        max_file_bytes = 2_000_000  # skip unusually large files
-
-        total = 0
-        for root, dirnames, files in os.walk(self.catalog_root):
-            # Prune directories in-place to avoid descending into them
-            dirnames[:] = [
-                d for d in dirnames
-                if d not in skip_dirs and not d.startswith(".")  # skip hidden dirs too
-            ]
-            for name in files:
-                p = Path(root) / name
-                if p.suffix.lower() not in text_exts:
-                    continue
-                try:
-                    st = p.stat()
-                    if st.st_size > max_file_bytes:
-                        continue
-                    with open(p, "r", encoding="utf-8", errors="ignore") as fh:
-                        for _ in fh:
-                            total += 1
-                except Exception:
-                    # ignore unreadable files
-                    continue
-        return total
+        def _bg_export():
+            try:
+                count, skipped, total_bytes = self._export_concat_markdown(out_path, _progress)
+            except Exception as e:
+                self._ui_post(lambda: self.error("Export Single File", f"Failed to export:\n{e}"))
+                return
+            self._ui_post(lambda: self.info(
+                "Export Single File",
+                f"Created:\n{out_path}\n\nConcatenated {count} file(s) (skipped {skipped}).\nSize: {total_bytes} bytes."
+            ))
+
+        # Streams to disk on a worker thread; the dialog and tree stay responsive
+        self._note("Exporting…", 2000)
+        self._submit_file_job(_bg_export)
 
     def _update_stats_on_save(self, path: Path, text: str):
-        files_total = self._count_md_recursive(self.catalog_root)
-        lines_total_repo = self._count_repo_lines()
-
-        stats = self.settings.get("stats", {})
-        stats["files_total"] = files_total
-        stats["lines_total"] = lines_total_repo
-        stats["last_saved_path"] = str(path)
-        stats["last_updated"] = datetime.datetime.now().isoformat(timespec="seconds")
-        self.settings["stats"] = stats
-        save_settings(self.settings)
-        self.refresh_git_mode_label()
+        """Recount repo stats on the Git thread; saves queued meanwhile share one recount."""
+        saved_at = datetime.datetime.now().isoformat(timespec="seconds")
+        with self._stats_lock:
+            self._stats_pending[os.fspath(path)] = saved_at
+        self._gitbg.submit(self._recompute_stats_bg, tag="stats")
+
+    def _recompute_stats_bg(self):
+        """Git thread: fold every save queued since the last run into the totals, then publish them."""
+        with self._stats_lock:
+            saved, self._stats_pending = self._stats_pending, {}
+        if not saved:
+            return
+        root = self.catalog_root
+        # Only the Git thread touches _line_counts / _stats_totals
+        if self._line_counts is None:
+            self._line_counts = load_line_cache(root)
+        now = time.monotonic()
+        totals = None
+        if self._stats_totals is not None and now - self._stats_full_at < _STATS_FULL_RESCAN_S:
+            # Only the saved files changed since the last walk: patch their line counts into the totals
+            files_total, lines_total = self._stats_totals
+            try:
+                for key in saved:
+                    if os.path.basename(key).lower().startswith(_EXPORT_NAME_PREFIXES):
+                        continue  # never counted (see compute_repo_stats)
+                    hit = self._line_counts.get(key)
+                    st = os.stat(key)
+                    if hit is None or st.st_size > _STATS_MAX_FILE_BYTES:
+                        raise LookupError(key)  # new or oversized file → full walk
+                    n = _count_file_lines(key, st.st_size)
+                    self._line_counts[key] = (st.st_mtime_ns, st.st_size, n)
+                    lines_total += n - hit[2]
+                totals = (files_total, lines_total)
+            except (OSError, LookupError):
+                pass
+        if totals is None:
+            # Full walk; unchanged files cost one stat
+            totals = compute_repo_stats(root, self._line_counts)
+            self._stats_full_at = now
+            save_line_cache(root, self._line_counts)
+        self._stats_totals = totals
+        files_total, lines_total_repo = totals
+        last_path, saved_at = next(reversed(saved.items()))
+
+        def _apply():
+            stats = self.settings.get("stats", {})
+            stats["files_total"] = files_total
+            stats["lines_total"] = lines_total_repo
+            stats["last_saved_path"] = last_path
+            stats["last_updated"] = saved_at
+            self.settings["stats"] = stats
+            self._schedule_settings_save()
+        self._gitbg.ui(_apply)
+
+    def _schedule_settings_save(self):
+        self._settings_dirty = True
+        if not self._settings_flush_timer.isActive():
+            self._settings_flush_timer.start()
+
+    def _flush_settings(self):
+        if self._settings_dirty:
+            self._settings_dirty = False
+            save_settings(self.settings)
 
     def _default_owner_for_context(self) -> str:
         s_owner = (self.settings.get("owner_default_name") or "").strip()
@@ -1696,19 +2994,19 @@ class CatalogWindow(QMainWindow):
     # ----- Robust "next default" filename (per-prefix counter + collision check)
     def _ensure_counter_for_prefix(self, prefix: str) -> int:
         c = self.settings.get("last_file_counters", {})
-        if prefix not in c:
-            c[prefix] = 0
-            self.settings["last_file_counters"] = c
-            save_settings(self.settings)
-            self.refresh_git_mode_label()
-        return c[prefix]
+        n = c.get(prefix)
+        if n is not None:
+            return n
+        c[prefix] = 0
+        self.settings["last_file_counters"] = c
+        self._schedule_settings_save()
+        return 0
 
     def _set_counter_for_prefix(self, prefix: str, value: int):
         c = self.settings.get("last_file_counters", {})
         c[prefix] = max(0, int(value))
         self.settings["last_file_counters"] = c
-        save_settings(self.settings)
-        self.refresh_git_mode_label()
+        self._schedule_settings_save()
 
     def _extract_number_from_name(self, prefix: str, name_no_ext: str):
         if not name_no_ext.startswith(prefix):
@@ -1725,11 +3023,13 @@ class CatalogWindow(QMainWindow):
         if base.is_file():
             base = base.parent
 
-        while True:
-            candidate = f"{prefix}{str(seq).zfill(width)}"
-            target = base / f"{candidate}.md"
-            if not target.exists():
-                break
+        # One directory listing instead of an exists() stat per candidate
+        try:
+            with os.scandir(base) as it:
+                taken = {os.path.normcase(e.name) for e in it}
+        except OSError:
+            taken = set()
+        while os.path.normcase(f"{prefix}{str(seq).zfill(width)}.md") in taken:
             seq += 1
 
         return f"{prefix}{str(seq).zfill(width)}"
@@ -1784,11 +3084,23 @@ class CatalogWindow(QMainWindow):
         current_rel = None
         errors = []
 
+        made: dict[str, Path] = {}
+
         def ensure_dir(rel_path: str) -> Path:
-            p = target / ("" if rel_path == "." else rel_path)
-            p.mkdir(parents=True, exist_ok=True)
+            p = made.get(rel_path)
+            if p is None:
+                p = target / ("" if rel_path == "." else rel_path)
+                p.mkdir(parents=True, exist_ok=True)
+                made[rel_path] = p
             return p
 
+        def read_fence(start: int) -> tuple[list, int]:
+            """Lines from `start` up to the closing ``` (exclusive) and the index just past it."""
+            end = start
+            while end < n and lines[end].strip() != "```":
+                end += 1
+            return lines[start:end], min(end + 1, n)
+
         while i < n:
             ln = lines[i].strip()
             if ln.startswith("## Folder:"):
@@ -1798,11 +3110,7 @@ class CatalogWindow(QMainWindow):
 
             if current_rel:
                 if ln == "```json meta":
-                    block = []
-                    i += 1
-                    while i < n and lines[i].strip() != "```":
-                        block.append(lines[i]); i += 1
-                    if i < n and lines[i].strip() == "```": i += 1
+                    block, i = read_fence(i + 1)
                     folder_p = ensure_dir(current_rel)
                     meta_p = folder_meta_path(folder_p)
                     try:
@@ -1815,19 +3123,15 @@ class CatalogWindow(QMainWindow):
                         if meta_p.exists() and not overwrite_all:
                             pass
                         else:
-                            meta_p.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+                            meta_p.write_bytes(json_dumps_indent(meta))
                     except Exception as e:
                         errors.append(f"{meta_p}: {e}")
                     continue
 
                 if ln.startswith("```markdown"):
-                    m = re.search(r'entry\s*=\s*"([^"]+)"', ln)
+                    m = _IMPORT_ENTRY_RE.search(ln)
                     entry_name = m.group(1) if m else None
-                    block = []
-                    i += 1
-                    while i < n and lines[i].strip() != "```":
-                        block.append(lines[i]); i += 1
-                    if i < n and lines[i].strip() == "```": i += 1
+                    block, i = read_fence(i + 1)
                     if entry_name:
                         folder_p = ensure_dir(current_rel)
                         file_p = folder_p / entry_name
@@ -1841,62 +3145,80 @@ class CatalogWindow(QMainWindow):
                     continue
             i += 1
 
-        self.fs_model.refresh(self.fs_model.index(str(self.catalog_root)))
-        self.update_file_counter()
+        # No model refresh: folders the tree has loaded are watched by fs_model, and the
+        # others are listed fresh when first expanded
+        self.update_file_counter(files_changed=True)
         if errors:
             self.warn("Import Catalog", "Import completed with some errors:\n" + "\n".join(errors[:20]) + ("\n..." if len(errors) > 20 else ""))
         else:
             self.info("Import Catalog", "Import completed successfully.")
 
-    def _export_concat_markdown(self, out_path: Path):
+    def _export_concat_markdown(self, out_path: Path, progress=None):
+        """
+        Concatenate every .md under the catalog into out_path, streaming one file at a time
+        (memory stays at one read buffer). progress(done, total) is called after each file.
+        Returns (files included, files skipped, bytes written as UTF-8).
+        """
         root = self.catalog_root.resolve()
         out_path = out_path.resolve()
 
+        # root is resolved and symlinked dirs aren't descended: only symlinked files need resolving,
+        # every other entry path already starts with "<root><sep>". Sort key built once per file.
+        root_s = os.fspath(root)
+        cut = len(os.path.join(root_s, ""))
         md_files = []
-        for folder, _, files in os.walk(root):
-            folder_p = Path(folder)
-            for name in files:
-                if name.lower().endswith(".md"):
-                    p = (folder_p / name).resolve()
-                    md_files.append(p)
-
-        md_files = sorted(md_files, key=lambda p: str(p.relative_to(root)).lower())
+        for e in _iter_md_entries(root_s):
+            if e.is_symlink():
+                path = os.path.realpath(e.path)
+                rel = os.path.relpath(path, root_s)
+            else:
+                path = e.path
+                rel = path[cut:]
+            md_files.append((rel.lower(), rel, path))
+        md_files.sort(key=lambda t: t[0])
 
+        out_key = os.path.normcase(os.fspath(out_path))
         included = []
         skipped = 0
-        for p in md_files:
-            if p == out_path:
+        for _, rel, path in md_files:
+            if os.path.normcase(path) == out_key:
                 skipped += 1
                 continue
-            included.append(p)
+            included.append((rel, path))
 
-        lines = []
         header = [
             "# Catalog — Concatenated Export",
             f"Generated: {datetime.datetime.now().isoformat(timespec='seconds')}",
             f"Root: {root}",
             "",
             "---",
-            ""
         ]
-        lines.extend(header)
-        for p in included:
-            rel = str(p.relative_to(root))
-            lines.append(f"# File: {rel}")
-            lines.append("")
-            try:
-                content = p.read_text(encoding="utf-8")
-            except Exception as e:
-                content = f"<!-- ERROR READING {rel}: {e} -->"
-            lines.append(content.rstrip("\n"))
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-
-        text = "\n".join(lines).rstrip() + "\n"
+        total_bytes = 0
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(text, encoding="utf-8")
-        return (len(included), skipped, len(text.encode("utf-8")))
+        crlf = os.linesep == "\r\n"
+        # Binary output, encoded once per piece; the byte count is taken from that same encode.
+        # Newlines are expanded by hand exactly where text mode would have done it.
+        with open(out_path, "wb") as dst:
+            def put(s: str):
+                nonlocal total_bytes
+                data = s.encode("utf-8")
+                total_bytes += len(data)
+                dst.write(data.replace(b"\n", b"\r\n") if crlf else data)
+
+            # Layout: header, then "\n\n# File: …\n\n<content>\n\n---" per file, then one "\n"
+            put("\n".join(header))
+            for n, (rel, path) in enumerate(included, 1):
+                put(f"\n\n# File: {rel}\n\n")
+                try:
+                    with open(path, "r", encoding="utf-8") as src:
+                        _copy_text_rstrip_newlines(src, put)
+                except Exception as e:
+                    put(f"<!-- ERROR READING {rel}: {e} -->")
+                put("\n\n---")
+                if progress is not None:
+                    progress(n, len(included))
+            put("\n")
+        return (len(included), skipped, total_bytes)
 
     # ---------- Tree rename handling / styling / dialogs ------------------------
     def on_fs_file_renamed(self, dir_path_str: str, old_name: str, new_name: str):
@@ -1905,35 +3227,45 @@ class CatalogWindow(QMainWindow):
             old_path = dir_path / old_name
             new_path = dir_path / new_name
 
-            if new_path.is_dir():
-                old_meta = new_path / f"{old_name}.json"
-                new_meta = new_path / f"{new_name}.json"
-                if old_meta.exists():
-                    if new_meta.exists():
-                        try: old_meta.unlink()
-                        except Exception: pass
-                    else:
-                        try: old_meta.rename(new_meta)
-                        except Exception:
-                            try:
-                                data = old_meta.read_text(encoding="utf-8")
-                                new_meta.write_text(data, encoding="utf-8")
-                                old_meta.unlink()
-                            except Exception:
-                                pass
-                self.proxy.refresh_desc(new_path)
-                if self.current_folder and (self.current_folder == old_path or self.current_folder.name == old_name and self.current_folder.parent == dir_path):
-                    self.current_folder = new_path
-                    self.path_label.setText(f"Folder: {new_path}")
-            else:
-                if new_path.suffix.lower() == ".md":
-                    self.proxy.refresh_desc(new_path)
-                if self.current_path and (self.current_path == old_path or (self.current_path.name == old_name and self.current_path.parent == dir_path)):
-                    self.current_path = new_path
-                    self.path_label.setText(f"File: {new_path}")
+            # The model has already renamed its node and knows the type: no stat
+            sidx = self.fs_model.index(str(new_path))
+            is_dir = self.fs_model.isDir(sidx) if sidx.isValid() else new_path.is_dir()
+            if is_dir:
+                self._move_folder_meta(new_path, old_name)
+            self._rebind_after_rename(old_path, new_path, is_dir)
         except Exception:
             pass
-        self.update_file_counter()
+        self.update_file_counter(files_changed=True)
+
+    def _move_folder_meta(self, folder: Path, old_name: str):
+        """After a folder rename, carry <old_name>.json over to <new name>.json (existing new meta wins)."""
+        old_meta = folder / f"{old_name}.json"
+        new_meta = folder / f"{folder.name}.json"
+        try:
+            # On a case-insensitive filesystem a case-only rename makes both names one file: just rename it
+            if new_meta.exists() and not os.path.samefile(old_meta, new_meta):
+                old_meta.unlink()  # the folder already has meta under its new name
+            else:
+                os.replace(old_meta, new_meta)  # same directory: one atomic rename
+        except OSError:
+            pass  # no old meta to carry over (or it can't be moved)
+
+    def _rebind_after_rename(self, old_path: Path, new_path: Path, is_dir: bool):
+        """Refresh the renamed row's description and re-point the open file/folder (also when inside a renamed folder)."""
+        if is_dir or new_path.suffix.lower() == ".md":
+            self.proxy.refresh_desc(new_path)
+        for attr, kind in (("current_path", "File"), ("current_folder", "Folder")):
+            cur = getattr(self, attr)
+            if not cur:
+                continue
+            if cur == old_path:
+                moved = new_path
+            elif is_dir and old_path in cur.parents:
+                moved = new_path / cur.relative_to(old_path)
+            else:
+                continue
+            setattr(self, attr, moved)
+            self.path_label.setText(f"{kind}: {moved}")
 
     def apply_dark_styles(self):
         self.setStyleSheet("""
@@ -2003,21 +3335,33 @@ class CatalogWindow(QMainWindow):
 
     # ---------- Dirty / autosave -----------------------------------------------
     def _wire_dirty_signals(self):
-        for ed in [self.netlist_edit, self.partlist_edit, self.cd_edit, self.ct_edit, self.da_edit]:
-            ed.textChanged.connect(self._mark_dirty)
-        self.review_edit.textChanged.connect(self._mark_dirty)
+        # Plain-text editors report through QTextDocument.modificationChanged, which fires once
+        # per clean→modified transition instead of on every keystroke; _clear_dirty re-arms it.
+        self._dirty_docs = tuple(ed.document() for ed in (
+            self.netlist_edit, self.partlist_edit, self.cd_edit, self.ct_edit, self.da_edit,
+            self.folder_summary, self.review_edit))
+        for doc in self._dirty_docs[:-1]:
+            doc.modificationChanged.connect(self._on_doc_modified)
+        self.review_edit.document().modificationChanged.connect(self._on_review_modified)
         for le in self.field_widgets.values():
             le.textChanged.connect(self._mark_dirty)
-        self.rev_table.itemChanged.connect(self._mark_dirty)
-        self.variant_table.itemChanged.connect(self._mark_dirty)
+        # Cell edits and added/removed rows; the reset on file load is not an edit
+        for model in (self.rev_model, self.variant_model):
+            model.dataChanged.connect(self._mark_dirty)
+            model.rowsInserted.connect(self._mark_dirty)
+            model.rowsRemoved.connect(self._mark_dirty)
         self.folder_title.textChanged.connect(self._mark_dirty)
         self.folder_desc.textChanged.connect(self._mark_dirty)
-        self.folder_summary.textChanged.connect(self._mark_dirty)
         self.folder_owner.textChanged.connect(self._mark_dirty)
         self.folder_tags.textChanged.connect(self._mark_dirty)
         # Rebuild schematic subtabs when Part Number changes (optional)
         if "Part Number" in self.field_widgets:
-            self.field_widgets["Part Number"].textChanged.connect(lambda *_: self._rebuild_schematic_tabs_from_scan())
+            self.field_widgets["Part Number"].textChanged.connect(self._on_part_number_changed)
+
+    def _on_part_number_changed(self, *args):
+        # load_file rebuilds the tabs itself after filling the fields
+        if not self.suppress_dirty:
+            self._pn_rescan_timer.start()
 
 
     def _rebuild_schematic_tabs_if_visible(self):
@@ -2029,32 +3373,64 @@ class CatalogWindow(QMainWindow):
         revs = self._collect_revs_from_table()
         self._build_schematic_tabs(current_pn, revs, base_dir)
 
-    def _on_review_changed(self):
-        self.review_dirty = True
-        self._mark_dirty()
+    def _on_doc_modified(self, modified: bool):
+        if modified:
+            self._mark_dirty()
+
+    def _on_review_modified(self, modified: bool):
+        if modified and not self.suppress_dirty:
+            self.review_dirty = True
+            self._mark_dirty()
 
     def _strip_dot(self, s: str) -> str:
         return s.lstrip("● ").strip()
 
     def _mark_dirty(self, *args):
-        if self.suppress_dirty:
+        # Hot path: every keystroke in every editor lands here; only the first one does work
+        if self.dirty or self.suppress_dirty:
             return
+        self.dirty = True
+        self.autosave_remaining_s = self.autosave_interval_s
+        self._dirty_title_timer.start()
+        self._wake_countdown()
+
+    def _on_first_dirty(self):
         if not self.dirty:
-            self.dirty = True
-            self.autosave_remaining_s = self.autosave_interval_s
-            self.autosave_label.setText(f"Autosave in: {self.autosave_remaining_s}s")
-            self.update_dirty_indicator()
+            return  # saved/reloaded before the debounce fired
+        self.autosave_label.setText(f"Autosave in: {self.autosave_remaining_s}s")
+        self.update_dirty_indicator()
 
     def update_dirty_indicator(self):
         if len(self.base_tab_titles) != self.tabs.count():
-            self.base_tab_titles = [self._strip_dot(self.tabs.tabText(i)) for i in range(self.tabs.count())]
-        for i, base in enumerate(self.base_tab_titles):
-            want = ("● " + base) if (self.dirty and i == self.tabs.currentIndex()) else base
-            if self.tabs.tabText(i) != want:
-                self.tabs.setTabText(i, want)
-        self.setWindowTitle(APP_TITLE + (" •" if self.dirty else ""))
+            self.base_tab_titles = tuple(self._strip_dot(self.tabs.tabText(i)) for i in range(self.tabs.count()))
+            self._dirty_indicator_state = None
+        # Titles depend only on (dirty, current tab); nothing to touch if neither moved
+        state = (self.dirty, self.tabs.currentIndex())
+        prev = self._dirty_indicator_state
+        if state == prev:
+            return
+        self._dirty_indicator_state = state
+        dirty, cur = state
+        titles = self.base_tab_titles
+        if prev is None:
+            for i, base in enumerate(titles):
+                want = _DIRTY_TAB_FMT.format(base) if (dirty and i == cur) else base
+                if self.tabs.tabText(i) != want:
+                    self.tabs.setTabText(i, want)
+        else:
+            # At most one tab carries the dot: the one we marked last time
+            was_dirty, was_cur = prev
+            if was_dirty and 0 <= was_cur < len(titles):
+                self.tabs.setTabText(was_cur, titles[was_cur])
+            if dirty and 0 <= cur < len(titles):
+                self.tabs.setTabText(cur, _DIRTY_TAB_FMT.format(titles[cur]))
+            if dirty == was_dirty:
+                return
+        self.setWindowTitle(_DIRTY_WINDOW_TITLE if dirty else APP_TITLE)
 
     def _clear_dirty(self):
+        for doc in self._dirty_docs:
+            doc.setModified(False)  # re-arm modificationChanged for the next edit
         if self.dirty:
             self.dirty = False
             self.update_dirty_indicator()
@@ -2063,9 +3439,23 @@ class CatalogWindow(QMainWindow):
         self.autosave_remaining_s = self.autosave_interval_s
         self.autosave_label.setText("Autosave in: —" if not self.dirty else f"Autosave in: {self.autosave_remaining_s}s")
 
+    def _wake_countdown(self):
+        t = getattr(self, "countdown_timer", None)
+        if t is not None and not t.isActive():
+            t.start()
+
     def _tick_autosave_countdown(self):
         """Drive autosave and (when enabled) non-blocking git push countdown once per second."""
 
+        # ---------- IDLE ----------
+        # Nothing to count down: settle the labels and stop ticking until _wake_countdown()
+        if not self.dirty and self.git_push_remaining_s is None:
+            self.autosave_label.setText("Autosave in: —")
+            self.autosave_remaining_s = self.autosave_interval_s
+            self.push_label.setText("Sync push in: —")
+            self.countdown_timer.stop()
+            return
+
         # ---------- AUTOSAVE ----------
         if not self.current_path and not self.current_folder:
             self.autosave_label.setText("Autosave in: —")
@@ -2120,7 +3510,7 @@ class CatalogWindow(QMainWindow):
 
                     rc, out, err = _git(self.catalog_root, "push", "origin", f"HEAD:{branch}")
                     if rc == -999:
-                        # Timeout → flip to Local-Only and surface a gentle notice
+                        # Timeout → surface a gentle notice and retry later (jittered)
                         self._handle_git_timeout("Push")
                     elif rc == 0:
                         rc2, sha, _ = _git(self.catalog_root, "rev-parse", "--short", "HEAD")
@@ -2140,7 +3530,7 @@ class CatalogWindow(QMainWindow):
 
             # Schedule background push and clear countdown.
             self.debug("Push: countdown reached 0 → dispatching")
-            self._gitbg.submit(_bg_push)
+            self._gitbg.submit(_bg_push, tag="push")
             self.git_push_remaining_s = None
             return
 
@@ -2152,74 +3542,127 @@ class CatalogWindow(QMainWindow):
     def _count_md_recursive(self, folder: Path, max_dirs: int = 5000, time_budget_s: float = 0.4) -> int:
         """
         Count *.md files quickly:
+        - Walk with os.scandir (DirEntry type checks reuse cached d_type; no extra stat).
         - Prune heavy/hidden/VCS/build dirs.
         - Skip symlinked directories.
         - Hard cap the number of directories and wall-clock time.
-        Returns the best-effort count; safe to call on the UI thread.
+        Returns the best-effort count; update_file_counter runs it on a worker thread.
         """
-        start = datetime.datetime.now().timestamp()
+        deadline = time.monotonic() + time_budget_s
         cnt = 0
         visited_dirs = 0
+        stack = [os.fspath(folder)]
         try:
-            for root, dirnames, files in os.walk(folder, followlinks=False):
-                # Prune dirs in-place (fast; prevents descending)
-                dirnames[:] = [d for d in dirnames if not self._should_skip_dir(root, d)]
+            while stack:
+                cur = stack.pop()
                 visited_dirs += 1
                 # Bounds to keep UI responsive
                 if visited_dirs >= max_dirs:
                     break
-                if (datetime.datetime.now().timestamp() - start) >= time_budget_s:
+                if time.monotonic() >= deadline:
                     break
-                # Count md files in this directory
-                for f in files:
-                    # quick check without lower(); avoids per-file alloc in large folders
-                    if f.endswith(".md") or f.endswith(".MD") or f.endswith(".Md") or f.endswith(".mD"):
-                        cnt += 1
+                try:
+                    with os.scandir(cur) as it:
+                        for entry in it:
+                            name = entry.name
+                            # follow_symlinks=False: symlinked dirs are never descended
+                            if entry.is_dir(follow_symlinks=False):
+                                if name[:1] != "." and name not in _SKIP_DIR_NAMES:
+                                    stack.append(entry.path)
+                            elif name.endswith(_MD_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                                cnt += 1
+                except OSError:
+                    continue
         except Exception:
             pass
         return cnt
 
     def _count_md_shallow(self, folder: Path) -> int:
         try:
-            return sum(1 for f in folder.iterdir() if f.is_file() and f.suffix.lower() == ".md")
+            with os.scandir(folder) as it:
+                return sum(
+                    1 for e in it
+                    if e.name.endswith(_MD_SUFFIXES) and e.is_file(follow_symlinks=False)
+                )
         except Exception:
             return 0
 
-    def update_file_counter(self):
+    def update_file_counter(self, files_changed: bool = False):
+        """Refresh the footer counts; files_changed=True when .md files may have been added/removed."""
+        if files_changed:
+            self._md_total_stale = True
         # Current-folder count: shallow and cheap
         sp = self.selected_path()
         folder = sp if (sp and sp.is_dir()) else (sp.parent if (sp and sp.is_file()) else self.catalog_root)
         in_folder = self._count_md_shallow(folder)
 
-        # Repo-wide total: cached + throttled
-        try:
-            import time
-            now = time.monotonic()
-            if (
-                self._md_total_cached is None
-                or (now - self._md_total_cached_when) >= self._md_total_min_interval_s
-            ):
-                self._md_total_cached = self._count_md_recursive(self.catalog_root)
-                self._md_total_cached_when = now
-            root_total = self._md_total_cached
-        except Exception:
-            root_total = 0
+        # Repo-wide total: cached + throttled; a stale value is recounted on a worker thread
+        now = time.monotonic()
+        if not self._md_total_inflight and (
+            self._md_total_stale
+            or (now - self._md_total_cached_when) >= self._md_total_min_interval_s
+        ):
+            self._md_total_inflight = True
+            self._md_total_stale = False  # changes from here on need another count
+            root = self.catalog_root
+
+            def _bg_count():
+                total = None
+                try:
+                    # Off the UI thread, so the walk can take longer than the default budget
+                    total = self._count_md_recursive(root, time_budget_s=_MD_TOTAL_BUDGET_S)
+                except Exception:
+                    pass
+                finally:
+                    self._ui_post(lambda: self._on_md_total_counted(total))
+
+            self._workers.submit(_bg_count)
+
+        self._md_in_folder = in_folder
+        self._set_md_counts_text()
+        self._request_sync_state_refresh()
+
+    def _on_md_total_counted(self, total: Optional[int]):
+        self._md_total_inflight = False
+        if total is not None:
+            self._md_total_cached = total
+            self._md_total_cached_when = time.monotonic()
+        self._set_md_counts_text()
+        if self._md_total_stale:
+            self._file_counter_timer.start()  # files changed while counting
+
+    def _set_md_counts_text(self):
+        root_total = "…" if self._md_total_cached is None else self._md_total_cached
+        self._md_counts_text = f"Files in folder: {self._md_in_folder} | Total: {root_total}"
+        self.counter_label.setText(f"{self._md_counts_text}; {self._sync_state_label}")
+
+    def _request_sync_state_refresh(self):
+        """Recompute ahead/behind/dirty on the Git thread; at most one refresh queued at a time."""
+        if self._sync_state_pending:
+            return
+        self._sync_state_pending = True
 
-        state_txt = self._sync_state_text()  # "Synchronized", "Out of Sync (ahead/behind/complex)"
-        self.counter_label.setText(f"Files in folder: {in_folder} | Total: {root_total}; {state_txt}")
-        try:
-            behind, ahead, dirty = self._ahead_behind_dirty()
-            # build the same text you show to the user:
-            base = self.counter_label.text().split(";")[0]  # "Files in folder: # | Total: #"
-            if behind and (ahead or dirty):  state = "Out of Sync (complex)"
-            elif behind:                     state = "Out of Sync (behind)"
-            elif ahead or dirty:             state = "Out of Sync (ahead)"
-            else:                            state = "Synchronized"
-            # show + log
-            self.counter_label.setText(f"{base}; {state}")
-            self._dbg_sync_line("footer", ahead=ahead, behind=behind, dirty=dirty, extra=f"→ {state}")
-        except Exception as ex:
-            self.debug(f"footer:update exception → {ex!r}")
+        def _bg_sync_state():
+            state = None
+            try:
+                if not self.settings.get("git_enabled", True):
+                    state = "Synchronized"  # Treat as inert when git is off
+                else:
+                    behind, ahead, dirty = self._ahead_behind_dirty()
+                    state = self._sync_state_text(behind, ahead, dirty)
+                    self._dbg_sync_line("footer", ahead=ahead, behind=behind, dirty=dirty, extra=f"→ {state}")
+            except Exception as ex:
+                self.debug(f"footer:update exception → {ex!r}")
+            finally:
+                self._sync_state_pending = False
+            if state:
+                self._gitbg.ui(lambda: self._set_sync_state_label(state))
+
+        self._gitbg.submit(_bg_sync_state)
+
+    def _set_sync_state_label(self, state: str):
+        self._sync_state_label = state
+        self.counter_label.setText(f"{self._md_counts_text}; {state}")
 
         # ---------- UI / selection helpers -----------------------------------------
     def show_file_ui(self, file_selected: bool):
@@ -2231,15 +3674,9 @@ class CatalogWindow(QMainWindow):
         """Disable all tabs except Review if filename starts with 'catlog_' or 'catalog_'."""
         is_export = False
         if current_file and current_file.is_file():
-            stem = current_file.stem.lower()
-            is_export = stem.startswith("catlog_") or stem.startswith("catalog_")
-        # Find Review tab index
-        review_idx = None
-        for i in range(self.tabs.count()):
-            if self._strip_dot(self.tabs.tabText(i)).lower() == "review":
-                review_idx = i
-                break
-        if review_idx is None:
+            is_export = current_file.stem.lower().startswith(_EXPORT_NAME_PREFIXES)
+        review_idx = self.tabs.indexOf(self._review_tab)
+        if review_idx < 0:
             return
         for i in range(self.tabs.count()):
             self.tabs.setTabEnabled(i, (i == review_idx) if is_export else True)
@@ -2276,28 +3713,19 @@ class CatalogWindow(QMainWindow):
 
     # ---------- Metadata helpers -----------------------------------------------
     def add_rev_row(self):
-        r = self.rev_table.rowCount()
-        self.rev_table.insertRow(r)
         defaults = ["", today_iso(), "", self._default_owner_for_context()]
-        if r == 0:
+        if self.rev_model.rowCount() == 0:
             defaults = ["-", today_iso(), "Initial release", self._default_owner_for_context()]
-        for c, val in enumerate(defaults):
-            self.rev_table.setItem(r, c, QTableWidgetItem(val))
+        self.rev_model.append_row(defaults)
 
     def remove_rev_row(self):
-        r = self.rev_table.currentRow()
-        if r >= 0:
-            self.rev_table.removeRow(r)
+        self.rev_model.remove_row(self.rev_table.currentIndex().row())
 
     def add_variant_row(self):
-        r = self.variant_table.rowCount()
-        self.variant_table.insertRow(r)
-        self.variant_table.setItem(r, 0, QTableWidgetItem(""))
+        self.variant_model.append_row()
 
     def remove_variant_row(self):
-        r = self.variant_table.currentRow()
-        if r >= 0:
-            self.variant_table.removeRow(r)
+        self.variant_model.remove_row(self.variant_table.currentIndex().row())
 
     # ---------- Selection / load -----------------------------------------------
     def on_tree_selection(self, *_):
@@ -2310,6 +3738,7 @@ class CatalogWindow(QMainWindow):
             self.update_file_counter()
             return
         if path.is_dir():
+            self._cancel_pending_load()
             self.current_path = None
             self.current_folder = path
             self.path_label.setText(f"Folder: {path}")
@@ -2320,7 +3749,7 @@ class CatalogWindow(QMainWindow):
         if path.is_file() and path.suffix.lower() == ".md":
             self.current_folder = None
             self._toggle_panels(folder_mode=False)
-            self.load_file(path)
+            self.load_file_async(path)
             self.update_file_counter()
 
     def _toggle_panels(self, folder_mode: bool):
@@ -2366,7 +3795,7 @@ class CatalogWindow(QMainWindow):
             else:
                 # create a default meta file (best-effort)
                 try:
-                    meta_p.write_text(json.dumps(default, indent=2), encoding="utf-8")
+                    meta_p.write_bytes(json_dumps_indent(default))
                 except Exception:
                     pass
                 return default
@@ -2377,48 +3806,111 @@ class CatalogWindow(QMainWindow):
     def load_folder_meta(self, folder: Path):
         self.suppress_dirty = True
         meta = self.read_folder_meta(folder)
-        self.folder_title.setText(meta.get("TITLE", ""))
-        self.folder_desc.setText(meta.get("DESCRIPTION", ""))
-        self.folder_summary.setPlainText(meta.get("Summary", ""))
-        self.folder_owner.setText(meta.get("Owner", ""))
         tags_val = meta.get("Tags", "")
         if isinstance(tags_val, list):
             tags_val = ", ".join(tags_val)
-        self.folder_tags.setText(tags_val)
+        edits = ((self.folder_title, meta.get("TITLE", "")), (self.folder_desc, meta.get("DESCRIPTION", "")),
+                 (self.folder_owner, meta.get("Owner", "")), (self.folder_tags, tags_val))
+        for w, _ in edits: w.blockSignals(True)  # filling them is not an edit
+        try:
+            for w, value in edits:
+                w.setText(value)
+        finally:
+            for w, _ in edits: w.blockSignals(False)
+        self.folder_summary.setPlainText(meta.get("Summary", ""))
         self.folder_created.setText(meta.get("Created", ""))
         self.folder_updated.setText(meta.get("Last Updated", ""))
         self.suppress_dirty = False
         self._clear_dirty()
         self._reset_autosave_countdown()
 
+    def _cancel_pending_load(self):
+        """Drop any background parse still in flight (its result will be ignored)."""
+        self._load_gen += 1
+        if not self.tabs.isEnabled():
+            self.tabs.setEnabled(True)
+
+    def load_file_async(self, path: Path):
+        """Like load_file, but large files are read and parsed on a worker thread."""
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+        if size < _ASYNC_LOAD_MIN_BYTES:
+            self.load_file(path)
+            return
+
+        self._cancel_pending_load()
+        gen = self._load_gen
+        pending = self._md_writer.pending(path)
+        # Nothing is bound to the form until the parse lands: autosave has no target meanwhile
+        self.current_path = None
+        self.path_label.setText(f"File: {path} (loading…)")
+        self.tabs.setEnabled(False)
+
+        def _bg_parse():
+            try:
+                text = pending if pending is not None else read_md_text(path)
+                parsed = self.parse_markdown(text)
+            except Exception as e:
+                self._ui_post(lambda: self._on_async_load_failed(gen, e))
+                return
+            self._ui_post(lambda: self._on_async_load_done(gen, path, text, parsed))
+
+        self._workers.submit(_bg_parse)
+
+    def _on_async_load_done(self, gen: int, path: Path, text: str, parsed: tuple):
+        if gen != self._load_gen:
+            return  # another selection superseded this one
+        self.tabs.setEnabled(True)
+        self._apply_loaded_file(path, text, parsed)
+        self.update_file_counter()
+
+    def _on_async_load_failed(self, gen: int, e: Exception):
+        if gen != self._load_gen:
+            return
+        self.tabs.setEnabled(True)
+        self.error("Error", f"Failed to read file:\n{e}")
+
     def load_file(self, path: Path):
+        self._cancel_pending_load()
         try:
-            text = path.read_text(encoding="utf-8")
+            text = self._md_writer.pending(path)  # a save still being written is the file's content
+            if text is None:
+                text = read_md_text(path)
         except Exception as e:
             self.error("Error", f"Failed to read file:\n{e}"); return
+        if not self.dirty and self._form_source == (path, text):
+            # Unedited form already shows exactly this text (just loaded or saved): rebind only
+            self.current_path = path
+            self.path_label.setText(f"File: {path}")
+            self._reset_autosave_countdown()
+            self._schedule_schematic_rescan()
+            self._lock_non_review_tabs_if_export(path)
+            return
+        self._apply_loaded_file(path, text, self.parse_markdown(text))
 
+    def _apply_loaded_file(self, path: Path, text: str, parsed: tuple):
+        """Fill the form from parse_markdown() output (UI thread)."""
         self.current_path = path
         self.path_label.setText(f"File: {path}")
 
-        (fields, rev_rows, variant_items, netlist, partlist_text, cd, ct, da) = self.parse_markdown(text)
+        (fields, rev_rows, variant_items, netlist, partlist_text, cd, ct, da) = parsed
 
         self.suppress_dirty = True
-        for key, _ in FIELD_ORDER:
-            self.field_widgets[key].setText(fields.get(key, ""))
-
-        self.rev_table.setRowCount(0)
-        for row in rev_rows:
-            rr = (row + [""] * len(REV_HEADERS))[:len(REV_HEADERS)]
-            r = self.rev_table.rowCount()
-            self.rev_table.insertRow(r)
-            for c, val in enumerate(rr):
-                self.rev_table.setItem(r, c, QTableWidgetItem(val))
-
-        self.variant_table.setRowCount(0)
-        for item in variant_items:
-            r = self.variant_table.rowCount()
-            self.variant_table.insertRow(r)
-            self.variant_table.setItem(r, 0, QTableWidgetItem(item))
+        # One repaint of the Introduction group; textChanged (dirty/PN rescan) stays quiet while filling
+        fw = self.field_widgets
+        self.fields_group.setUpdatesEnabled(False)
+        for w in fw.values(): w.blockSignals(True)
+        try:
+            for key in _FIELD_KEYS:
+                fw[key].setText(fields.get(key, ""))
+        finally:
+            for w in fw.values(): w.blockSignals(False)
+            self.fields_group.setUpdatesEnabled(True)
+
+        self.rev_model.set_rows(rev_rows)
+        self.variant_model.set_rows([item] for item in variant_items)
 
         self.netlist_edit.setPlainText(netlist)
         self.partlist_edit.setPlainText(partlist_text)
@@ -2426,85 +3918,104 @@ class CatalogWindow(QMainWindow):
         self.ct_edit.setPlainText(ct)
         self.da_edit.setPlainText(da)
 
-        self.review_edit.blockSignals(True)
-        self.review_edit.setPlainText(text)
-        self.review_edit.blockSignals(False)
+        self._set_review_text(text)
         self.review_dirty = False
+        self._form_source = (path, text)
 
         self.suppress_dirty = False
         self._clear_dirty()
         self._reset_autosave_countdown()
         self.proxy.refresh_desc(path)
         
-        # Build schematic subtabs by scanning the configured folder for PN_*.pdf
-        self._rebuild_schematic_tabs_from_scan()
+        # Schematic subtabs (PN_*.pdf folder scan) are built when Documents is shown
+        self._schedule_schematic_rescan()
 
         # Lock tabs if this is an export/aggregate file
         self._lock_non_review_tabs_if_export(self.current_path)
 
-    # ---------- Parse / Build markdown -----------------------------------------
-    def _find_section(self, lines, title: str):
-        want = f"## {title}".lower()
-        for i, ln in enumerate(lines):
-            if ln.strip().lower() == want:
-                return i
-        return None
+    def _set_review_text(self, text: str):
+        """Set the Review editor text; deferred until the Review tab is shown."""
+        if self.tabs.currentWidget() is self._review_tab:
+            self._review_pending_text = None
+            self._apply_review_text(text)
+        else:
+            self._review_pending_text = text
 
-    def _read_section_text(self, lines, start_idx: int) -> str:
-        j = start_idx + 1
-        out = []
-        n = len(lines)
-        while j < n and not lines[j].startswith("## "):
-            out.append(lines[j]); j += 1
-        while out and not out[0].strip(): out.pop(0)
-        while out and not out[-1].strip(): out.pop()
-        return "\n".join(out)
+    def _apply_review_text(self, text: str):
+        """Replace the Review editor text (signals blocked); no-op if it already matches."""
+        # setPlainText re-lays out the whole document, so skip it when nothing changed
+        if self.review_edit.toPlainText() == text:
+            return
+        doc = self.review_edit.document()
+        suppressed, self.suppress_dirty = self.suppress_dirty, True
+        self.review_edit.blockSignals(True)
+        doc.setUndoRedoEnabled(False)  # bulk replace: don't record it as an undo step
+        try:
+            self.review_edit.setPlainText(text)
+        finally:
+            doc.setUndoRedoEnabled(True)
+            doc.setModified(False)
+            self.review_edit.blockSignals(False)
+            self.suppress_dirty = suppressed
+
+    def _on_tab_changed(self, idx: int):
+        w = self.tabs.widget(idx)
+        if self._review_pending_text is not None and w is self._review_tab:
+            text, self._review_pending_text = self._review_pending_text, None
+            self._apply_review_text(text)
+        elif w is self.schematic_tab:
+            if self._schematic_tabs_dirty:
+                self._schematic_tabs_dirty = False
+                self._rebuild_schematic_tabs_from_scan()
+            self._on_schematic_tab_changed(self.schematic_tabs.currentIndex())
 
-    def _parse_table_at(self, lines, start_idx: int):
+    # ---------- Parse / Build markdown -----------------------------------------
+    def _read_section_text(self, lines, kinds, start_idx: int, end_idx: int) -> str:
+        # Trim blank lines at both ends of the section body
+        lo, hi = start_idx + 1, end_idx
+        while lo < hi and kinds[lo] & _LK_BLANK: lo += 1
+        while hi > lo and kinds[hi - 1] & _LK_BLANK: hi -= 1
+        return "\n".join(lines[lo:hi])
+
+    def _parse_table_at(self, stripped, kinds, start_idx: int, end_idx: int):
         rows = []
-        if start_idx is None:
-            return rows
         j = start_idx + 1
-        n = len(lines)
-        # find header
-        while j < n and not lines[j].strip().startswith("|"):
-            if lines[j].strip().startswith("## "):
+        n = len(stripped)
+        # find header (within the section); an indented "## " line also ends the search
+        while j < end_idx and not kinds[j] & _LK_TABLE:
+            if stripped[j].startswith("## "):
                 return rows
             j += 1
-        if j >= n:
+        if j >= end_idx:
             return rows
         # skip divider lines
         j += 1
-        while j < n and lines[j].strip().startswith("|") and _is_md_divider_line(lines[j]):
+        while j < n and kinds[j] & _LK_DIVIDER:
+            j += 1
+        # consume body (cells stripped by map in C; rows stay lists for the table model)
+        append = rows.append
+        strip = str.strip
+        while j < n and kinds[j] & _LK_TABLE:
+            if not kinds[j] & _LK_DIVIDER:
+                append(list(map(strip, stripped[j].strip("|").split("|"))))
             j += 1
-        # consume body
-        while j < n and lines[j].strip().startswith("|"):
-            if _is_md_divider_line(lines[j]):
-                j += 1; continue
-            raw = lines[j].strip().strip("|")
-            cells = [c.strip() for c in raw.split("|")]
-            rows.append(cells); j += 1
         return rows
 
-    def _parse_bulleted_list(self, lines, start_idx: int):
+    def _parse_bulleted_list(self, stripped, kinds, start_idx: int, end_idx: int):
         items = []
-        if start_idx is None: return items
-        j = start_idx + 1
-        n = len(lines)
-        while j < n and not lines[j].startswith("## "):
-            s = lines[j].strip()
-            if s.startswith("- "):
-                items.append(s[2:].strip())
-            elif s.startswith("* "):
-                items.append(s[2:].strip())
-            j += 1
+        for j in range(start_idx + 1, end_idx):
+            if kinds[j] & _LK_BULLET:
+                items.append(stripped[j][2:].strip())
         items = [it for it in items if it.lower() != "(none)"]
         return items
 
     def parse_markdown(self, text: str):
-        lines = [ln.rstrip("\n") for ln in text.splitlines()]
-        fields = {k: "" for k, _ in FIELD_ORDER}
-        rev_rows = []
+        lines = text.splitlines()  # terminators already dropped (read_md_text normalises \r)
+        sections = {}
+        heads = []
+        stripped = []
+        kinds = _classify_lines(lines, sections, heads, stripped)  # the only full pass
+        fields = dict.fromkeys(_FIELD_KEYS, "")
         variant_items = []
         netlist = ""
         partlist_text = ""
@@ -2512,112 +4023,102 @@ class CatalogWindow(QMainWindow):
 
         i = 0; n = len(lines)
         while i < n:
-            if lines[i].strip().lower().startswith("| field") and "| value" in lines[i].lower():
+            if kinds[i] & _LK_TABLE and stripped[i].lower().startswith("| field") and "| value" in stripped[i].lower():
                 i += 2
-                while i < n and lines[i].strip().startswith("|"):
-                    m = MD_ROW_RE.match(lines[i].strip())
-                    if m:
-                        field = m.group("field").strip()
-                        value = m.group("value").strip()
-                        if field in fields: fields[field] = value
+                while i < n and kinds[i] & _LK_TABLE:
+                    # Exactly "| field | value |" (table lines start with "|"); other shapes are ignored
+                    row = stripped[i]
+                    if row.endswith("|"):
+                        cells = row[1:-1].split("|")
+                        if len(cells) == 2:
+                            field = cells[0].strip()
+                            if field in fields: fields[field] = cells[1].strip()
                     i += 1
                 break
             i += 1
 
-        rhx = self._find_section(lines, "Revision History")
-        if rhx is not None:
-            j = rhx + 1
-            while j < n and not lines[j].strip().startswith("|"):
-                if lines[j].strip().startswith("## "):
-                    j = None; break
-                j += 1
-            if j is not None:
-                j += 1
-                while j < n and lines[j].strip().startswith("|") and _is_md_divider_line(lines[j]):
-                    j += 1
-                while j < n and lines[j].strip().startswith("|"):
-                    if _is_md_divider_line(lines[j]):
-                        j += 1; continue
-                    raw = lines[j].strip().strip("|")
-                    cells = [c.strip() for c in raw.split("|")]
-                    rev_rows.append(cells); j += 1
-
-        vdx = self._find_section(lines, "Variant Details")
-        if vdx is not None:
-            variant_items = self._parse_bulleted_list(lines, vdx)
-
-        nix = self._find_section(lines, "Netlist")
-        if nix is not None:
-            netlist = self._read_section_text(lines, nix)
-
-        pix = self._find_section(lines, "Partlist")
-        if pix is not None:
-            tmp = self._read_section_text(lines, pix)
-            partlist_text = tmp if tmp.strip() else f"| {' | '.join(PARTLIST_HEADERS)} |\n{_divider_for(PARTLIST_HEADERS)}"
-
-        cdx = self._find_section(lines, SECTION_TITLES["cd"])
-        if cdx is not None: cd = self._read_section_text(lines, cdx)
-        ctx = self._find_section(lines, SECTION_TITLES["ct"])
-        if ctx is not None: ct = self._read_section_text(lines, ctx)
-        dax = self._find_section(lines, SECTION_TITLES["da"])
-        if dax is not None: da = self._read_section_text(lines, dax)
+        def span(title: str):
+            """(header index, next "## " line or len(lines)) for a parsed section, or None."""
+            start = sections.get(title)
+            if start is None:
+                return None
+            k = bisect_right(heads, start)
+            return start, (heads[k] if k < len(heads) else n)
+
+        rh = span("revision history")
+        rev_rows = self._parse_table_at(stripped, kinds, *rh) if rh else []
+
+        vd = span("variant details")
+        if vd is not None:
+            variant_items = self._parse_bulleted_list(stripped, kinds, *vd)
+
+        nl = span("netlist")
+        if nl is not None:
+            netlist = self._read_section_text(lines, kinds, *nl)
+
+        pl = span("partlist")
+        if pl is not None:
+            tmp = self._read_section_text(lines, kinds, *pl)
+            partlist_text = tmp if tmp.strip() else _PARTLIST_EMPTY_TABLE
+
+        cds = span(SECTION_TITLES["cd"].lower())
+        if cds is not None: cd = self._read_section_text(lines, kinds, *cds)
+        cts = span(SECTION_TITLES["ct"].lower())
+        if cts is not None: ct = self._read_section_text(lines, kinds, *cts)
+        das = span(SECTION_TITLES["da"].lower())
+        if das is not None: da = self._read_section_text(lines, kinds, *das)
 
         return fields, rev_rows, variant_items, netlist, partlist_text, cd, ct, da
 
     def build_markdown(self, fields: dict, rev_rows: list, variant_items: list, netlist: str, partlist_text: str, cd: str, ct: str, da: str) -> str:
-        intro_lines = [
-            "| Field                  | Value                     |",
-            "| ---------------------- | ------------------------- |",
+        out = [
+            "# Circuit Metadata", "",
+            f"**Last Updated:** {today_iso()}", "",
+            "## Introduction", "",
+            *_INTRO_TABLE_HEAD,
         ]
-        for key, _ in FIELD_ORDER:
-            intro_lines.append(f"| {key:<22} | {fields.get(key,'').strip()} |")
+        append = out.append
+        for prefix, (key, _) in zip(_INTRO_ROW_PREFIXES, FIELD_ORDER):
+            append(prefix + fields.get(key, '').strip() + " |")
 
-        def build_table(headers, rows):
-            out = ["| " + " | ".join(headers) + " |", _divider_for(headers)]
+        def add_rev_table(rows):
+            n = len(REV_HEADERS)
+            out.extend(_REV_TABLE_HEAD)
             for r in rows:
                 if _is_divider_cells([x.strip() for x in r]): continue
-                rr = (r + [""] * len(headers))[:len(headers)]
-                out.append("| " + " | ".join(rr) + " |")
-            return "\n".join(out)
+                append("| " + " | ".join((r + [""] * n)[:n]) + " |")
 
-        def build_variant_list(items):
+        def add_variant_list(items):
             items = [it.strip() for it in items if it.strip()]
-            if not items: return "- (none)"
-            return "\n".join(f"- {it}" for it in items)
-
-        ptxt = (partlist_text or "").strip()
-        if not ptxt:
-            ptxt = f"| {' | '.join(PARTLIST_HEADERS)} |\n{_divider_for(PARTLIST_HEADERS)}"
+            if not items: append("- (none)"); return
+            out.extend(f"- {it}" for it in items)
 
-        def block(h, body):
+        def add_block(h, body):
             body = (body or "").strip()
-            return [f"## {h}", "", (body if body else "(Click or type to add content…)")]
+            out.extend((f"## {h}", "", body if body else "(Click or type to add content…)", ""))
 
-        out = [
-            "# Circuit Metadata", "",
-            f"**Last Updated:** {today_iso()}", "",
-            "## Introduction", "",
-            "\n".join(intro_lines), "",
-            "## Revision History", "",
-            build_table(REV_HEADERS, rev_rows), "",
-            "## Variant Details", "",
-            build_variant_list(variant_items), "",
-            *block("Netlist", netlist), "",
-            "## Partlist", "",
-            ptxt, "",
-            *block(SECTION_TITLES["cd"], cd), "",
-            *block(SECTION_TITLES["ct"], ct), "",
-            *block(SECTION_TITLES["da"], da), "",
-        ]
+        ptxt = (partlist_text or "").strip()
+        if not ptxt:
+            ptxt = _PARTLIST_EMPTY_TABLE
+
+        out += ("", "## Revision History", "")
+        add_rev_table(rev_rows)
+        out += ("", "## Variant Details", "")
+        add_variant_list(variant_items)
+        append("")
+        add_block("Netlist", netlist)
+        out += ("## Partlist", "", ptxt, "")
+        add_block(SECTION_TITLES["cd"], cd)
+        add_block(SECTION_TITLES["ct"], ct)
+        add_block(SECTION_TITLES["da"], da)
         return "\n".join(out).rstrip() + "\n"
     # ---------- Schematic (PDF) helpers ---------------------------------------
     def _collect_revs_from_table(self) -> list[str]:
         """Return ordered, de-duplicated list of Rev column values (non-empty)."""
         seen = set()
         revs = []
-        for r in range(self.rev_table.rowCount()):
-            it = self.rev_table.item(r, 0)
-            rev = (it.text().strip() if it else "")
+        for row in self.rev_model.rows():
+            rev = row[0].strip()
             if rev and rev not in seen:
                 seen.add(rev)
                 revs.append(rev)
@@ -2625,9 +4126,7 @@ class CatalogWindow(QMainWindow):
 
     def _build_schematic_tabs(self, pn: str, revs: list[str], base_dir: Path):
         """Rebuild the schematic sub-tabs based on PN and revision list."""
-        # Clear old tabs
-        while self.schematic_tabs.count():
-            self.schematic_tabs.removeTab(0)
+        self._clear_schematic_tabs()
 
         if not pn:
             msg = QLabel("Part Number is empty.\nPopulate Introduction → Part Number.", self.schematic_tab)
@@ -2660,9 +4159,9 @@ class CatalogWindow(QMainWindow):
             self.schematic_tabs.addTab(holder, rev)
 
     def _on_schematic_tab_changed(self, idx: int):
-        """Lazy-load the PDF viewer when a subtab is first selected."""
-        if idx < 0:
-            return
+        """Lazy-load the PDF viewer when a subtab is first selected while Documents is shown."""
+        if idx < 0 or self.tabs.currentWidget() is not self.schematic_tab:
+            return  # _on_tab_changed loads the current subtab once Documents is opened
 
         w = self.schematic_tabs.widget(idx)
         if w is None:
@@ -2729,97 +4228,48 @@ class CatalogWindow(QMainWindow):
 
     # ---------- Save ------------------------------------------------------------
     def save_from_form(self, silent: bool = False):
-        """Save current file or folder metadata, commit the change, and schedule a background push."""
+        """Save current file or folder metadata; pull/commit run on the Git thread, then a push is scheduled."""
         self.debug(f"Save: start → file={self.current_path} folder={self.current_folder}")
 
-        # Decide if we should try to commit/push after saving (default yes).
-        # We’ll flip this to False if the pre-save pull indicates conflicts/failure.
-        allow_commit_push = True
-
-        # Only attempt a pre-save pull when we’re saving something real (file or folder)
-        something_selected = (
-            (self.current_path and self.current_path.is_file()) or
-            (self.current_folder and self.current_folder.is_dir())
-        )
-        if something_selected:
-            ok_to_commit = self._safe_pull_before_save()
-            if not ok_to_commit:
-                allow_commit_push = False
+        # One stat per target (autosave runs this on a timer)
+        path_is_file = bool(self.current_path) and _stat_is(self.current_path, stat.S_ISREG)
+        is_md_file = path_is_file and self.current_path.suffix.lower() == ".md"
+        folder_is_dir = bool(self.current_folder) and _stat_is(self.current_folder, stat.S_ISDIR)
 
         # ---- Save Markdown file ----
-        if self.current_path and self.current_path.is_file() and self.current_path.suffix.lower() == ".md":
+        if is_md_file:
             # If the Review tab was edited or Review is active, save raw text verbatim
-            if self.review_dirty or self._strip_dot(self.tabs.tabText(self.tabs.currentIndex())) == "Review":
+            if self.review_dirty or self.tabs.currentWidget() is self._review_tab:
                 raw = self.review_edit.toPlainText()
-                try:
-                    self.current_path.write_text(raw, encoding="utf-8")
-                except Exception as e:
-                    self.error("Error", f"Failed to save file:\n{e}")
-                    return
+                self._write_md_in_background(self.current_path, raw)
 
                 if not silent:
-                    self.load_file(self.current_path)
+                    # Refresh the form from the text just saved (what a re-read would return)
+                    self._apply_loaded_file(self.current_path, raw, self.parse_markdown(raw))
+                else:
+                    self._form_source = None  # form fields still show the pre-edit content
 
                 self.review_dirty = False
                 self._clear_dirty()
                 self._reset_autosave_countdown()
-                self._update_stats_on_save(self.current_path, raw)
-                self.update_file_counter()
-
-                # Commit and schedule push (if allowed)
-                if allow_commit_push and bool(self.settings.get("git_enabled", True)):
-                    try:
-                        highest = _highest_rev_from_table(self.rev_table) if hasattr(self, "rev_table") else "-"
-                        msg = self._commit_msg_for_file(self.current_path, highest)
-                        # Stage and commit ONLY the current file (path-scoped)
-                        _git(self.catalog_root, "add", str(self.current_path))
-                        rc_chk, _, _ = _git(self.catalog_root, "diff", "--cached", "--quiet", "--", str(self.current_path))
-                        if rc_chk == 0:
-                            # No staged change for this path → nothing to commit
-                            self.statusBar().showMessage("No changes to commit.", 2000)
-                            self.debug("Commit: no changes (file-specific)")
-                        else:
-                            self.debug(f"Commit (file): {self.current_path.name} → {msg}")
-                            rc_c, _, err_c = _git(self.catalog_root, "commit", "-m", msg, "--", str(self.current_path))
-                            if rc_c == -999:
-                                self._handle_git_timeout("Commit")
-                            elif rc_c == 0:
-                                rc_sha, sha, _ = _git(self.catalog_root, "rev-parse", "--short", "HEAD")
-                                if rc_sha == 0 and sha:
-                                    self.statusBar().showMessage(f"Committed {sha}: {msg}", 3000)
-                                self._schedule_git_push()
-                            else:
-                                self.statusBar().showMessage(f"Commit failed: {err_c or 'unknown error'}", 5000)
-                                self.debug(f"Commit: fail → {err_c or 'unknown error'}")
-                    except Exception as ex:
-                        self.debug(f"Commit: exception → {ex!r}")
-                else:
-                    # Either git disabled or pull failed → skip commit/push
-                    if bool(self.settings.get("git_enabled", True)) and not allow_commit_push:
-                        self.debug("Commit: skipped due to pre-save pull failure/conflict")
-
                 return
 
             # Structured save (form → markdown)
             fields = {k: w.text().strip() for k, w in self.field_widgets.items()}
 
             rev_rows = []
-            for r in range(self.rev_table.rowCount()):
-                row = []
-                for c in range(len(REV_HEADERS)):
-                    it = self.rev_table.item(r, c)
-                    row.append(it.text().strip() if it else "")
+            owner = None  # looked up once, and only if some row needs it (may read folder JSON)
+            strip = str.strip
+            for cells in self.rev_model.rows():
+                row = list(map(strip, cells))
                 # Backfill empty “By” with default owner if blank
-                if len(row) >= 4 and not row[3].strip():
-                    row[3] = self._default_owner_for_context()
+                if len(row) >= 4 and not row[3]:
+                    if owner is None:
+                        owner = self._default_owner_for_context()
+                    row[3] = owner
                 rev_rows.append(row)
 
-            variant_items = []
-            for r in range(self.variant_table.rowCount()):
-                it = self.variant_table.item(r, 0)
-                txt = it.text().strip() if it else ""
-                if txt:
-                    variant_items.append(txt)
+            variant_items = [txt for txt in (cells[0].strip() for cells in self.variant_model.rows()) if txt]
 
             netlist = self.netlist_edit.toPlainText()
             partlist_text = self.partlist_edit.toPlainText()
@@ -2828,56 +4278,17 @@ class CatalogWindow(QMainWindow):
             da = self.da_edit.toPlainText()
 
             text = self.build_markdown(fields, rev_rows, variant_items, netlist, partlist_text, cd, ct, da)
+            self._write_md_in_background(self.current_path, text)
 
-            try:
-                self.current_path.write_text(text, encoding="utf-8")
-            except Exception as e:
-                self.error("Error", f"Failed to save file:\n{e}")
-                return
-
-            self.review_edit.blockSignals(True)
-            self.review_edit.setPlainText(text)
-            self.review_edit.blockSignals(False)
+            self._set_review_text(text)
             self.review_dirty = False
+            self._form_source = (self.current_path, text)
             self._clear_dirty()
             self._reset_autosave_countdown()
-            self.proxy.refresh_desc(self.current_path)
-            self._update_stats_on_save(self.current_path, text)
-            self.update_file_counter()
-
-            # Commit and schedule push (if allowed)
-            if allow_commit_push and bool(self.settings.get("git_enabled", True)):
-                try:
-                    highest = _highest_rev_from_table(self.rev_table) if hasattr(self, "rev_table") else "-"
-                    msg = self._commit_msg_for_file(self.current_path, highest)
-                    self.debug(f"Commit (file): {self.current_path.name} → {msg}")
-                    _git(self.catalog_root, "add", str(self.current_path))
-                    rc_chk, _, _ = _git(self.catalog_root, "diff", "--cached", "--quiet", "--", str(self.current_path))
-                    if rc_chk == 0:
-                        self.statusBar().showMessage("No changes to commit.", 2000)
-                        self.debug("Commit: no changes (file-specific)")
-                    else:
-                        rc_c, _, err_c = _git(self.catalog_root, "commit", "-m", msg, "--", str(self.current_path))
-                        if rc_c == -999:
-                            self._handle_git_timeout("Commit")
-                        elif rc_c == 0:
-                            rc_sha, sha, _ = _git(self.catalog_root, "rev-parse", "--short", "HEAD")
-                            if rc_sha == 0 and sha:
-                                self.statusBar().showMessage(f"Committed {sha}: {msg}", 3000)
-                            self._schedule_git_push()
-                        else:
-                            self.statusBar().showMessage(f"Commit failed: {err_c or 'unknown error'}", 5000)
-                            self.debug(f"Commit: fail → {err_c or 'unknown error'}")
-                except Exception as ex:
-                    self.debug(f"Commit: exception → {ex!r}")
-            else:
-                if bool(self.settings.get("git_enabled", True)) and not allow_commit_push:
-                    self.debug("Commit: skipped due to pre-save pull failure/conflict")
-
             return
 
         # ---- Save folder metadata ----
-        if self.current_folder and self.current_folder.exists() and self.current_folder.is_dir():
+        if folder_is_dir:
             meta_p = folder_meta_path(self.current_folder)
             created = today_iso()
             if meta_p.exists():
@@ -2900,38 +4311,13 @@ class CatalogWindow(QMainWindow):
                 "Last Updated": today_iso(),
             }
             try:
-                meta_p.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+                meta_p.write_bytes(json_dumps_indent(meta))
             except Exception as e:
                 self.error("Error", f"Failed to save folder metadata:\n{e}")
                 return
 
-            # Commit and schedule push (folder metadata JSON only)
-            if allow_commit_push and bool(self.settings.get("git_enabled", True)):
-                try:
-                    msg = f"Folder '{self.current_folder.name}' metadata updated"
-                    _git(self.catalog_root, "add", str(meta_p))
-                    rc_chk, _, _ = _git(self.catalog_root, "diff", "--cached", "--quiet", "--", str(meta_p))
-                    if rc_chk == 0:
-                        self.statusBar().showMessage("No changes to commit.", 2000)
-                        self.debug("Commit: no changes (folder meta)")
-                    else:
-                        self.debug(f"Commit (folder meta): {meta_p.name} → {msg}")
-                        rc_c, _, err_c = _git(self.catalog_root, "commit", "-m", msg, "--", str(meta_p))
-                        if rc_c == -999:
-                            self._handle_git_timeout("Commit")
-                        elif rc_c == 0:
-                            rc_sha, sha, _ = _git(self.catalog_root, "rev-parse", "--short", "HEAD")
-                            if rc_sha == 0 and sha:
-                                self.statusBar().showMessage(f"Committed {sha}: {msg}", 3000)
-                            self._schedule_git_push()
-                        else:
-                            self.statusBar().showMessage(f"Commit failed: {err_c or 'unknown error'}", 5000)
-                            self.debug(f"Commit: fail → {err_c or 'unknown error'}")
-                except Exception as ex:
-                    self.debug(f"Commit: exception → {ex!r}")
-            else:
-                if bool(self.settings.get("git_enabled", True)) and not allow_commit_push:
-                    self.debug("Commit: skipped due to pre-save pull failure/conflict")
+            # Pre-save pull + commit (folder metadata JSON only) off the UI thread
+            self._commit_in_background(meta_p, f"Folder '{self.current_folder.name}' metadata updated")
 
             self.proxy.refresh_desc(self.current_folder)
             self.folder_created.setText(meta["Created"])
@@ -2947,6 +4333,95 @@ class CatalogWindow(QMainWindow):
         if not silent:
             self.info("Save", "Select a folder or a Markdown file to save.")
 
+    def _write_md_in_background(self, path: Path, text: str):
+        """Hand a .md save to the writer thread; stats, the tree title and the commit follow once it lands."""
+        # The commit message reads the form, so take it now
+        highest = _highest_rev_from_rows(self.rev_model.rows())
+        msg = self._commit_msg_for_file(path, highest)
+
+        def _done(err):
+            if err is None:
+                self._ui_post(lambda: self._on_md_written(path, text, msg))
+            else:
+                self._ui_post(lambda: self._on_md_write_failed(path, err))
+
+        self._md_writer.submit(path, text, _done)
+
+    def _on_md_written(self, path: Path, text: str, msg: str):
+        # Queue the commit first: a failing refresh below must not lose it
+        # Pre-save pull + commit (path-scoped) off the UI thread
+        self._commit_in_background(path, msg)
+        self.proxy.refresh_desc(path)
+        self._update_stats_on_save(path, text)
+        self.update_file_counter()
+
+    def _on_md_write_failed(self, path: Path, err: Exception):
+        if path == self.current_path:
+            self._mark_dirty()  # still unsaved: autosave retries
+        self.error("Error", f"Failed to save file:\n{err}")
+
+    def _commit_in_background(self, path: Path, msg: str):
+        """
+        Add `path` to the pending commit batch; returns immediately.
+        Saves arriving within GIT_COMMIT_COALESCE_MS of each other are committed together
+        (one path-scoped commit, one pull --rebase, one push countdown).
+        """
+        if not bool(self.settings.get("git_enabled", True)):
+            return
+        self._commit_batch[str(path)] = (path, msg)
+        self._commit_batch_timer.start()  # (re)start the coalescing window
+
+    def _flush_commit_batch(self):
+        """
+        Hand the pending batch to the Git thread: one commit for all paths, then pull --rebase.
+        The file is already written, so committing first is what lets incoming edits to the same
+        lines conflict (rebase aborts, commit stays local, no push) instead of being overwritten.
+        """
+        batch, self._commit_batch = self._commit_batch, {}
+        if not batch:
+            return
+        paths = [p for p, _ in batch.values()]
+        msgs = list(dict.fromkeys(m for _, m in batch.values()))  # distinct, in save order
+        msg = "; ".join(msgs)
+
+        def _bg_commit_and_pull():
+            if not self._git_commit_paths(paths, msg):
+                return
+            if self._safe_pull_rebase():
+                self._gitbg.ui(self._schedule_git_push)
+            else:
+                self.debug("Push: skipped due to pull failure/conflict; commit kept locally")
+
+        self.debug(f"Commit: batch of {len(paths)} path(s) queued")
+        self._gitbg.submit(_bg_commit_and_pull)
+
+    def _git_commit_paths(self, paths: list[Path], msg: str) -> bool:
+        """Stage and commit ONLY `paths`; runs on the Git thread. True if a commit was made."""
+        try:
+            names = ", ".join(p.name for p in paths)
+            path_args = [str(p) for p in paths]
+            # One status call decides; a clean save spawns nothing else
+            if git_changed_paths(self.catalog_root, *path_args) == []:
+                self._gitbg.ui(lambda: self.statusBar().showMessage("No changes to commit.", 2000))
+                self.debug(f"Commit: no changes ({names})")
+                return False
+            _git(self.catalog_root, "add", "--", *path_args)
+            self.debug(f"Commit: {names} → {msg}")
+            rc_c, _, err_c = _git(self.catalog_root, "commit", "-m", msg, "--", *path_args)
+            if rc_c == -999:
+                self._handle_git_timeout("Commit")
+            elif rc_c == 0:
+                rc_sha, sha, _ = _git(self.catalog_root, "rev-parse", "--short", "HEAD")
+                if rc_sha == 0 and sha:
+                    self._gitbg.ui(lambda: self.statusBar().showMessage(f"Committed {sha}: {msg}", 3000))
+                return True
+            else:
+                self._gitbg.ui(lambda: self.statusBar().showMessage(f"Commit failed: {err_c or 'unknown error'}", 5000))
+                self.debug(f"Commit: fail → {err_c or 'unknown error'}")
+        except Exception as ex:
+            self.debug(f"Commit: exception → {ex!r}")
+        return False
+
     def open_file_location(self):
         path = self.selected_path()
         if not path:
@@ -3012,7 +4487,7 @@ class CatalogWindow(QMainWindow):
         if sidx.isValid():
             pidx = self.proxy.mapFromSource(sidx)
             if pidx.isValid(): self.tree.setCurrentIndex(pidx)
-        self.update_file_counter()
+        self.update_file_counter(files_changed=True)
 
     def rename_item(self):
         paths = self.selected_paths()
@@ -3094,44 +4569,21 @@ class CatalogWindow(QMainWindow):
             self.warn("Exists", "Target name already exists.")
             return
 
+        self._md_writer.flush()  # a queued save must not recreate the old name
         try:
             if path.is_dir():
-                old_folder_name = path.name
                 path.rename(new_path)
-
-                old_meta = new_path / f"{old_folder_name}.json"
-                new_meta = new_path / f"{new_path.name}.json"
-                if old_meta.exists():
-                    if new_meta.exists():
-                        try: old_meta.unlink()
-                        except Exception: pass
-                    else:
-                        try: old_meta.rename(new_meta)
-                        except Exception:
-                            try:
-                                data = old_meta.read_text(encoding="utf-8")
-                                new_meta.write_text(data, encoding="utf-8")
-                                old_meta.unlink()
-                            except Exception:
-                                pass
-
-                self.proxy.refresh_desc(new_path)
-
-                if self.current_folder and self.current_folder == path:
-                    self.current_folder = new_path
-                    self.path_label.setText(f"Folder: {new_path}")
+                self._move_folder_meta(new_path, path.name)
+                self._rebind_after_rename(path, new_path, True)
 
             else:
                 path.rename(new_path)
-                self.proxy.refresh_desc(new_path)
-                if self.current_path and self.current_path == path:
-                    self.current_path = new_path
-                    self.path_label.setText(f"File: {new_path}")
+                self._rebind_after_rename(path, new_path, False)
 
         except Exception as e:
             self.error("Error", f"Failed to rename:\n{e}")
 
-        self.update_file_counter()
+        self.update_file_counter(files_changed=True)
 
     def debug(self, msg: str):
         try:
@@ -3139,12 +4591,21 @@ class CatalogWindow(QMainWindow):
         except Exception:
             pass
 
+    def _drain_debug_log(self):
+        """One appendPlainText per tick; while the console is hidden, lines wait (bounded) in the buffer."""
+        if not self.debug_console.isVisible():
+            return
+        batch = self._logger.drain()
+        if batch:
+            self.debug_console.appendPlainText("\n".join(batch))
+
     def delete_item(self):
         path = self.selected_path()
         if not path: return
         typ = "folder" if path.is_dir() else "file"
         if not self.ask_yes_no("Delete", f"Delete this {typ}?\n{path}"):
             return
+        self._md_writer.flush()  # a queued save must not recreate the deleted file
         try:
             if path.is_dir(): shutil.rmtree(path)
             else: path.unlink()
@@ -3154,9 +4615,10 @@ class CatalogWindow(QMainWindow):
             self.current_path = None; self.path_label.setText("")
         if self.current_folder and self.current_folder == path:
             self.current_folder = None; self.path_label.setText("")
-        self.update_file_counter()
+        self.update_file_counter(files_changed=True)
 
-    def _schedule_git_push(self):
+    def _schedule_git_push(self, jitter: bool = False):
+        """(Re)start the push countdown. jitter=True (retry after a timeout) adds up to half a delay."""
         mode = git_mode_from_settings(self.settings)
         if mode != GitMode.FULL:
             self.git_push_remaining_s = None
@@ -3169,11 +4631,27 @@ class CatalogWindow(QMainWindow):
         except Exception:
             delay = 60
         delay = max(1, delay)
+        if jitter:
+            delay += random.randint(0, max(1, delay // 2))
 
         self.git_push_delay_s = delay
         self.git_push_remaining_s = delay
         self.push_label.setText(f"Sync push in: {self.git_push_remaining_s}s")
         self.debug(f"Push: scheduled in {self.git_push_remaining_s}s")
+        self._wake_countdown()
+
+    def _handle_git_timeout(self, op: str):
+        """
+        A git subcommand hit its wall-clock limit (rc -999); callable from any thread.
+        Network operations re-arm the push countdown with jitter so a flaky link is retried
+        later instead of immediately. Git mode is left alone: a timeout is usually transient.
+        """
+        self.debug(f"{op}: timed out")
+        def _ui():
+            self._note(f"Git {op.lower()} timed out; changes are saved locally and will be retried.", 6000)
+            if op in ("Push", "Pull", "Fetch"):
+                self._schedule_git_push(jitter=True)
+        self._ui_post(_ui)
 
     def _note(self, msg: str, ms: int = 4000):
         try:
@@ -3181,10 +4659,10 @@ class CatalogWindow(QMainWindow):
         except Exception:
             pass
     
-    def _safe_pull_before_save(self) -> bool:
+    def _safe_pull_rebase(self) -> bool:
         """
-        Try to pull latest changes before we write/commit.
-        Returns True if it's safe to proceed with commit/push, False if we should skip commit.
+        Rebase the just-made save commit onto the latest remote (runs on the Git thread).
+        Returns True if it's safe to push, False if we should skip the push (commit stays local).
         Never raises; logs to the debug console and status bar instead.
         """
         mode = git_mode_from_settings(self.settings)
@@ -3192,9 +4670,8 @@ class CatalogWindow(QMainWindow):
             self.debug(f"Pull: skipped (git mode={mode.name})")
             return True
 
-        # Require an 'origin' remote; if not present, just proceed locally
-        rc, remotes, _ = _git(self.catalog_root, "remote")
-        if rc != 0 or "origin" not in (remotes or "").splitlines():
+        # Require an 'origin' remote; if not present, just proceed locally (cached remote list, no fork per save)
+        if not self._has_origin():
             self.debug("Pull: skipped (no origin)")
             return True
 
@@ -3202,30 +4679,30 @@ class CatalogWindow(QMainWindow):
 
         try:
             # Fetch first for clarity
-            self.debug(f"Pull: pre-save fetch origin/{branch}")
+            self.debug(f"Pull: fetch origin/{branch}")
             _git(self.catalog_root, "fetch", "origin", branch)
 
             # Pull with rebase; autostash helps when there are local changes
-            self.debug(f"Pull: pre-save pull --rebase --autostash from origin/{branch}")
+            self.debug(f"Pull: pull --rebase --autostash from origin/{branch}")
             rc, out, err = _git(self.catalog_root, "pull", "--rebase", "--autostash", "origin", branch)
             if rc == 0:
-                self.debug("Pull: pre-save OK")
+                self.debug("Pull: OK")
                 return True
 
-            # If rebase conflicts, try to abort cleanly and skip commit/push
-            self.debug(f"Pull: pre-save failed; attempting rebase --abort → {err or out}")
+            # If rebase conflicts, try to abort cleanly and skip the push
+            self.debug(f"Pull: failed; attempting rebase --abort → {err or out}")
             _git(self.catalog_root, "rebase", "--abort")
             self._gitbg.ui(lambda: self.statusBar().showMessage(
-                "Remote changes conflict with your local edits. Saved locally; commit/push skipped. Resolve and save again.",
+                "Remote changes conflict with your local edits. Saved and committed locally; push skipped. Resolve and save again.",
                 6000
             ))
             return False
 
         except Exception as ex:
-            self.debug(f"Pull: pre-save exception → {ex!r}")
-            # Conservative: allow save, but skip commit/push
+            self.debug(f"Pull: exception → {ex!r}")
+            # Conservative: keep the local commit, but skip the push
             self._gitbg.ui(lambda: self.statusBar().showMessage(
-                "Pre-save pull failed. Saved locally; commit/push skipped.", 6000
+                "Pull failed. Saved and committed locally; push skipped.", 6000
             ))
             return False
 
@@ -3238,33 +4715,34 @@ class CatalogWindow(QMainWindow):
             return
 
         ts = now_stamp()
-        temp_base = Path(tempfile.gettempdir()) / ts
+        temp_zip = Path(tempfile.gettempdir()) / f"{ts}.zip"
 
-        try:
-            # Create zip of the script folder (parent=root_dir, base_dir=folder name)
-            shutil.make_archive(str(temp_base), 'zip',
-                                root_dir=str(script_dir.parent),
-                                base_dir=script_dir.name)
-        except Exception as e:
-            self.error("Archive", f"Failed to create archive:\n{e}")
-            return
+        def _progress(done: int):
+            self._ui_post(lambda: self._note(f"Archiving… {done} file(s)", 2000))
 
-        temp_zip = Path(str(temp_base) + ".zip")
-        if not temp_zip.exists():
-            self.error("Archive", "Archive creation failed (file missing).")
-            return
+        def _bg_archive():
+            try:
+                # Zip of the script folder (arcnames start with the folder name); the PDF page cache is derived data
+                zip_folder(script_dir, temp_zip, exclude_dirs=frozenset({PDF_CACHE_DIR.name, STATS_CACHE_PATH.parent.name}), progress=_progress)
+            except Exception as e:
+                self._ui_post(lambda: self.error("Archive", f"Failed to create archive:\n{e}"))
+                return
 
-        dest_zip = script_dir / f"{ts}.zip"
-        try:
-            if dest_zip.exists():
-                # Avoid overwrite if same-second archive already exists
-                dest_zip = script_dir / f"{ts}_1.zip"
-            shutil.move(str(temp_zip), str(dest_zip))
-        except Exception as e:
-            self.error("Archive", f"Failed to move archive into folder:\n{e}")
-            return
+            dest_zip = script_dir / f"{ts}.zip"
+            try:
+                if dest_zip.exists():
+                    # Avoid overwrite if same-second archive already exists
+                    dest_zip = script_dir / f"{ts}_1.zip"
+                shutil.move(str(temp_zip), str(dest_zip))
+            except Exception as e:
+                self._ui_post(lambda: self.error("Archive", f"Failed to move archive into folder:\n{e}"))
+                return
 
-        self.info("Archive", f"Created: {dest_zip}")
+            self._ui_post(lambda: self.info("Archive", f"Created: {dest_zip}"))
+
+        # Compression is I/O + zlib bound; keep it off the UI thread
+        self._note("Archiving…", 2000)
+        self._submit_file_job(_bg_archive)
 
     def _commit_msg_for_file(self, file_path: Path, highest_rev: str | None) -> str:
         """
@@ -3301,20 +4779,6 @@ class CatalogWindow(QMainWindow):
             pass
         return super().eventFilter(obj, ev)
 
-    def _should_skip_dir(self, parent: str, d: str) -> bool:
-        skip_dirs = {
-            ".git", ".hg", ".svn", "__pycache__", ".mypy_cache", ".pytest_cache",
-            ".ruff_cache", "node_modules", "build", "dist", ".venv", "venv"
-        }
-        if d in skip_dirs or d.startswith("."):
-            return True
-        # Skip symlinked directories entirely (often point outside the tree)
-        try:
-            full = os.path.join(parent, d)
-            return os.path.islink(full)
-        except Exception:
-            return True
-
     def _on_search_text_changed(self, text: str):
         """Apply proxy filter and queue a safe expand/collapse."""
         self.proxy.setFilterText(text)
@@ -3364,81 +4828,15 @@ class CatalogWindow(QMainWindow):
             # Never crash the UI because of the label
             self.git_mode_label.setText("Git: Full")
 
-    def _ahead_behind_dirty(self) -> tuple[int, int, bool]:
-        """
-        Return (behind_cnt, ahead_cnt, dirty_worktree), with helpful debug:
-        - prefers upstream @{u}; otherwise origin/<branch> if present
-        - only fetches in FULL mode (so 'behind' is fresh there)
-        """
-        # Dirty?
-        rc_s, out_s, err_s = _git(self.catalog_root, "status", "--porcelain")
-        dirty = (rc_s == 0 and bool((out_s or "").strip()))
-        mode = git_mode_from_settings(self.settings)
-
-        # Upstream?
-        rc_u, _, _ = _git(self.catalog_root, "rev-parse", "--symbolic-full-name", "--abbrev-ref", "@{u}")
-        has_upstream = (rc_u == 0)
-
-        # Fetch only if FULL
-        remote_ref = ""
-        if mode == GitMode.FULL:
-            br = self._current_branch()
-            self._dbg_sync_line("ahead_behind:fetch", extra=f"mode={mode.name}, branch={br}")
-            _git(self.catalog_root, "fetch", "origin", br)
-            remote_ref = "@{u}" if has_upstream else f"origin/{br}"
-        else:
-            br = self._current_branch()
-            remote_ref = "@{u}" if has_upstream else (f"origin/{br}" if self._has_origin() else "")
-            self._dbg_sync_line("ahead_behind:nofetch", extra=f"mode={mode.name}, remote_ref={remote_ref or 'none'}")
-
-        if not remote_ref:
-            self._dbg_sync_line("ahead_behind:local_only", dirty=dirty, extra="no remote/upstream")
-            return (0, 0, dirty)
-
-        rc_ab, out_ab, err_ab = _git(self.catalog_root, "rev-list", "--left-right", "--count", f"{remote_ref}...HEAD")
-        if rc_ab != 0 or not (out_ab or "").strip():
-            self._dbg_sync_line("ahead_behind:error", dirty=dirty, extra=f"rc={rc_ab} err={err_ab or '—'}")
-            return (0, 0, dirty)
-
-        try:
-            left, right = out_ab.replace("\t", " ").split()[:2]
-            behind, ahead = int(left), int(right)
-        except Exception:
-            behind = ahead = 0
-
-        self._dbg_sync_line("ahead_behind:result", ahead=ahead, behind=behind, dirty=dirty, extra=f"mode={mode.name} ref={remote_ref}")
-        return behind, ahead, dirty
-    
-    def _sync_state_text(self) -> str:
-        mode = git_mode_from_settings(self.settings)
-        if not self.settings.get("git_enabled", True):
-            return "Synchronized"  # Treat as inert when git is off
-        behind, ahead, dirty = self._ahead_behind_dirty()
-        if behind == 0 and ahead == 0 and not dirty:
-            return "Synchronized"
-        if behind > 0 and (ahead > 0 or dirty):
+    def _sync_state_text(self, behind: int, ahead: int, dirty: bool) -> str:
+        """Footer wording for (behind, ahead, dirty) as returned by _ahead_behind_dirty()."""
+        if behind and (ahead or dirty):
             return "Out of Sync (complex)"
-        if behind > 0 and ahead == 0 and not dirty:
+        if behind:
             return "Out of Sync (behind)"
-        # local changes or ahead only
-        return "Out of Sync (ahead)"
-
-    def _path_last_commit_ts(self, rev: str, relpath: str) -> int | None:
-        rc, out, _ = _git(self.catalog_root, "log", "-1", "--format=%ct", rev, "--", relpath)
-        try:
-            return int(out.strip()) if (rc == 0 and out.strip()) else None
-        except Exception:
-            return None
-
-    def _path_fs_mtime_ts(self, abspath: Path) -> int | None:
-        try:
-            return int(abspath.stat().st_mtime)
-        except Exception:
-            return None
-
-    def _remote_has_path(self, rev: str, relpath: str) -> bool:
-        rc, out, _ = _git(self.catalog_root, "ls-tree", "-r", "--name-only", rev, "--", relpath)
-        return (rc == 0 and out.strip() == relpath)
+        if ahead or dirty:
+            return "Out of Sync (ahead)"
+        return "Synchronized"
 
     def sync_repo(self):
         """
@@ -3446,10 +4844,12 @@ class CatalogWindow(QMainWindow):
         - FULL + git_enabled: per-file newest-wins vs remote (fetch/commit/push/pull).
         - Otherwise: local-only consolidate (stage everything and commit if needed).
         """
-        try:
-            ensure_git_repo(self.catalog_root, self.settings)
-        except Exception:
-            pass
+        def _bg_ensure_repo():
+            try:
+                ensure_git_repo(self.catalog_root, self.settings)
+            except Exception:
+                pass
+        self._gitbg.submit(_bg_ensure_repo)
 
         mode = git_mode_from_settings(self.settings)
         self.debug(f"Sync button: pressed (mode={mode.name}, git_enabled={bool(self.settings.get('git_enabled', True))})")
@@ -3457,8 +4857,8 @@ class CatalogWindow(QMainWindow):
             self._gitbg.submit(self._bg_sync_repo_full)
         else:
             # Still do a useful local sync so the button “works” in Off/Local-Only
-            self._gitbg.ui(lambda: self.statusBar().showMessage(
-                "Network sync disabled (Git not Full). Consolidating locally…", 4000))
+            self.statusBar().showMessage(
+                "Network sync disabled (Git not Full). Consolidating locally…", 4000)
             self._gitbg.submit(self._bg_sync_repo_local_only)
 
     def _ahead_behind_dirty(self) -> tuple[int, int, bool]:
@@ -3467,26 +4867,27 @@ class CatalogWindow(QMainWindow):
         Uses upstream @{u} when available; otherwise falls back to origin/<branch>.
         We only fetch in FULL mode; ahead still increments without a fetch.
         """
-        # Worktree dirty?
-        rc_s, out_s, _ = _git(self.catalog_root, "status", "--porcelain")
+        # Independent local probes run concurrently: worktree dirty?, upstream (@{u}) set?, HEAD branch
+        (rc_s, out_s, _), (rc_u, _, _), (rc_b, out_b, _) = git_probe_all(
+            self.catalog_root,
+            ("status", "--porcelain"),
+            ("rev-parse", "--symbolic-full-name", "--abbrev-ref", "@{u}"),
+            ("rev-parse", "--abbrev-ref", "HEAD"),
+        )
         dirty = (rc_s == 0 and bool((out_s or "").strip()))
+        has_upstream = (rc_u == 0)
+        branch = self._branch_or_default(rc_b, out_b)
 
         behind = ahead = 0
 
-        # Prefer upstream (@{u}) when set
-        rc_u, _, _ = _git(self.catalog_root, "rev-parse", "--symbolic-full-name", "--abbrev-ref", "@{u}")
-        has_upstream = (rc_u == 0)
-
         # Fetch only if FULL (keeps behind fresh), but not required for "ahead"
         mode = git_mode_from_settings(self.settings)
         if mode == GitMode.FULL:
-            branch = self._current_branch()
             _git(self.catalog_root, "fetch", "origin", branch)
 
         if has_upstream:
             rc_ab, out_ab, _ = _git(self.catalog_root, "rev-list", "--left-right", "--count", "@{u}...HEAD")
         elif self._has_origin():
-            branch = self._current_branch()
             rc_ab, out_ab, _ = _git(self.catalog_root, "rev-list", "--left-right", "--count", f"origin/{branch}...HEAD")
         else:
             return (0, 0, dirty)
@@ -3508,26 +4909,43 @@ class CatalogWindow(QMainWindow):
             self.debug("Sync (local-only): start")
             self._gitbg.ui(lambda: self.statusBar().showMessage("Local sync in progress…", 2000))
 
-            # Stage deletions/renames/modified/untracked
-            _git(self.catalog_root, "add", "-A")
-
-            # If anything is staged, commit
-            self.debug("Sync(local): add -A")
-            rc_diff, _, _ = _git(self.catalog_root, "diff", "--cached", "--quiet")
-            self.debug(f"Sync(local): staged? {'yes' if rc_diff!=0 else 'no'}")
-            if rc_diff != 0:
+            # One status call: nothing changed → no add, no commit
+            changed = git_changed_paths(self.catalog_root)
+            if changed is None:
+                # Status failed; stage everything and let diff --cached decide
+                _git(self.catalog_root, "add", "-A")
+                self.debug("Sync(local): add -A")
+                rc_diff, _, _ = _git(self.catalog_root, "diff", "--cached", "--quiet")
+                has_changes = rc_diff != 0
+            elif changed and len(changed) < _STATUS_SMALL_CHANGESET:
+                # Stage deletions/renames/modified/untracked by name (no whole-tree walk)
+                rc_add, _, _ = _git(self.catalog_root, "add", "-A", "--", *_top_pathspecs(changed))
+                if rc_add != 0:
+                    # e.g. a path already removed from the index matches nothing → stage everything
+                    _git(self.catalog_root, "add", "-A")
+                self.debug(f"Sync(local): add {len(changed)} path(s)")
+                has_changes = True
+            else:
+                if changed:
+                    _git(self.catalog_root, "add", "-A")
+                    self.debug("Sync(local): add -A")
+                has_changes = bool(changed)
+            self.debug(f"Sync(local): staged? {'yes' if has_changes else 'no'}")
+            if has_changes:
                 msg = "Sync (local-only): consolidate working tree"
-                rc_c, _, err_c = _git(self.catalog_root, "commit", "-m", msg)
+                rc_c, out_c, err_c = _git(self.catalog_root, "commit", "-m", msg)
                 if rc_c == -999:
-                    self._handle_git_timeout("Commit")  # flips to Local-Only label, harmless here
+                    self._handle_git_timeout("Commit")
+                elif rc_c != 0 and "nothing to commit" in (out_c or ""):
+                    self.debug("Sync (local-only): nothing to commit")
                 elif rc_c != 0:
                     self.debug(f"Sync (local-only): commit failed → {err_c or 'unknown error'}")
                     self._gitbg.ui(lambda: self.statusBar().showMessage("Local sync commit failed.", 5000))
-                    self._gitbg.ui(self.update_file_counter)
+                    self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
                     return
 
             self._gitbg.ui(lambda: self.statusBar().showMessage("Local sync complete.", 2500))
-            self._gitbg.ui(self.update_file_counter)
+            self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
             self.debug("Sync (local-only): done")
         except Exception as ex:
             self.debug(f"Sync (local-only): exception → {ex!r}")
@@ -3549,6 +4967,10 @@ class CatalogWindow(QMainWindow):
                 return
 
             self.debug(f"Sync(full): fetched origin/{branch}")
+            # Pin origin/<branch> to a commit id so the per-path probes below
+            # don't depend on ref lookups inside the long-lived cat-file process
+            rc_r, remote_sha, _ = _git(self.catalog_root, "rev-parse", f"origin/{branch}")
+            remote_rev = remote_sha if (rc_r == 0 and remote_sha) else f"origin/{branch}"
             b0, a0, d0 = self._ahead_behind_dirty()
             self._dbg_sync_line("Sync(full):pre", ahead=a0, behind=b0, dirty=d0)
 
@@ -3580,9 +5002,9 @@ class CatalogWindow(QMainWindow):
                 abs_p = (self.catalog_root / rel)
 
                 local_ts = self._path_fs_mtime_ts(abs_p) if rel in wt_paths or rel in local_changed else self._path_last_commit_ts("HEAD", rel)
-                remote_ts = self._path_last_commit_ts(f"origin/{branch}", rel)
+                remote_ts = self._path_last_commit_ts(remote_rev, rel)
 
-                remote_has = self._remote_has_path(f"origin/{branch}", rel)
+                remote_has = self._remote_has_path(remote_rev, rel)
                 local_exists = abs_p.exists()
 
                 # Remote deleted this path?
@@ -3628,7 +5050,7 @@ class CatalogWindow(QMainWindow):
                 if rc_c != 0:
                     self.debug(f"Sync: commit failed → {err_c or 'unknown error'}")
                     self._gitbg.ui(lambda: self.statusBar().showMessage("Sync commit failed.", 5000))
-                    self._gitbg.ui(self.update_file_counter)
+                    self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
                     return
                 else:
                     self.debug("Sync: commit ok")
@@ -3636,7 +5058,7 @@ class CatalogWindow(QMainWindow):
             # 4) Decide whether to push even if no new commit happened
             if not self._has_origin():
                 self.debug("Sync: no 'origin' remote; skipping push/pull")
-                self._gitbg.ui(self.update_file_counter)
+                self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
                 return
 
             # Refresh ahead/behind (fetch already done)
@@ -3651,12 +5073,12 @@ class CatalogWindow(QMainWindow):
                 rc_p, _, err_p = _git(self.catalog_root, *push_args)
                 if rc_p == -999:
                     self._handle_git_timeout("Push")
-                    self._gitbg.ui(self.update_file_counter)
+                    self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
                     return
                 if rc_p != 0:
                     self.debug(f"Sync: push failed → {err_p or 'unknown error'}")
                     self._gitbg.ui(lambda: self.statusBar().showMessage("Sync push failed.", 5000))
-                    self._gitbg.ui(self.update_file_counter)
+                    self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
                     return
                 self.debug("Sync: push ok")
 
@@ -3686,7 +5108,7 @@ class CatalogWindow(QMainWindow):
                     self._gitbg.ui(lambda: self.statusBar().showMessage("Already synchronized.", 2000))
 
             # Update the footer + summary
-            self._gitbg.ui(self.update_file_counter)
+            self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
             if took_remote or kept_local or removed_local or staged_new:
                 self.debug(
                     "Sync summary →"
@@ -3700,15 +5122,17 @@ class CatalogWindow(QMainWindow):
         except Exception as ex:
             self.debug(f"Sync (full): exception → {ex!r}")
             self._gitbg.ui(lambda: self.statusBar().showMessage("Sync failed (exception).", 5000))
-            self._gitbg.ui(self.update_file_counter)
+            self._gitbg.ui(lambda: self.update_file_counter(files_changed=True))
 
     def _has_origin(self) -> bool:
-        rc, remotes, _ = _git(self.catalog_root, "remote")
-        return (rc == 0 and "origin" in (remotes or "").splitlines())
+        return "origin" in git_remotes(self.catalog_root)
 
     def _current_branch(self) -> str:
-        # Prefer actual HEAD branch; fall back to settings
         rc, out, _ = _git(self.catalog_root, "rev-parse", "--abbrev-ref", "HEAD")
+        return self._branch_or_default(rc, out)
+
+    def _branch_or_default(self, rc: int, out: str) -> str:
+        # Prefer actual HEAD branch (from `rev-parse --abbrev-ref HEAD`); fall back to settings
         if rc == 0 and out.strip() and out.strip() != "HEAD":
             return out.strip()
         return (self.settings.get("git_branch") or "main").strip() or "main"
@@ -3731,36 +5155,19 @@ class CatalogWindow(QMainWindow):
             return None
 
     def _remote_has_path(self, rev: str, relpath: str) -> bool:
-        rc, out, _ = _git(self.catalog_root, "ls-tree", "-r", "--name-only", rev, "--", relpath)
-        return (rc == 0 and out.strip() == relpath)
+        # Answered by the long-lived cat-file pipe (no fork+exec per path)
+        if self._git_catfile is None:
+            self._git_catfile = _GitCatFile(self.catalog_root)
+        return self._git_catfile.object_type(f"{rev}:./{relpath}") == "blob"
 
     def _poll_remote_sync_status(self):
         """
         Refresh footer status every 60s.
-        - In Git: Full → do a quick background fetch (keeps ahead/behind fresh), then update footer.
-        - In Local-Only / Off or git disabled → just refresh footer from local state.
+        The sync-state refresh runs on the Git thread and already fetches in Git: Full
+        (keeps ahead/behind fresh); Local-Only / Off just read local state.
         Never blocks the UI.
         """
-        if not self.settings.get("git_enabled", True):
-            # Git disabled → show whatever local says
-            self.update_file_counter()
-            return
-
-        mode = git_mode_from_settings(self.settings)
-        if mode == GitMode.FULL:
-            def _bg_fetch_then_refresh():
-                try:
-                    branch = (self.settings.get("git_branch") or "main").strip() or "main"
-                    _git(self.catalog_root, "fetch", "origin", branch)
-                except Exception:
-                    pass
-                finally:
-                    # Update the footer on the UI thread
-                    self._gitbg.ui(self.update_file_counter)
-            self._gitbg.submit(_bg_fetch_then_refresh)
-        else:
-            # Local-Only or Off → no network, but still refresh label (dirty/ahead local)
-            self.update_file_counter()
+        self.update_file_counter()
 
     def _mode_name(self) -> str:
         try:
@@ -3776,6 +5183,38 @@ class CatalogWindow(QMainWindow):
         if extra: parts.append(extra)
         self.debug(" | ".join(parts))
 
+    def closeEvent(self, e):
+        # Queued saves must reach disk before exit
+        try:
+            self._md_writer.close()
+        except Exception:
+            pass
+        # An export/archive cut off mid-write leaves a truncated .md/.zip: let running ones finish
+        jobs = [f for f in self._file_jobs if not f.done()]
+        if jobs:
+            self._note("Finishing export/archive…", 0)
+            wait_futures(jobs)
+        # Run the writer's completion callbacks now: they queue the last saves for commit
+        QApplication.sendPostedEvents(self._ui_invoker, 0)
+        # Commit that batch now instead of after the coalescing window
+        self._commit_batch_timer.stop()
+        self._flush_commit_batch()
+        # Only after the callbacks above (they may still submit a count): queued counts/parses are moot now
+        self._workers.shutdown(wait=False, cancel_futures=True)
+        # Let the Git thread finish the queued jobs (bounded) and exit, then drop the cat-file pipe
+        try:
+            self._gitbg.shutdown(GIT_SHUTDOWN_WAIT_S)
+        except Exception:
+            pass
+        self._settings_flush_timer.stop()
+        self._flush_settings()
+        try:
+            if self._git_catfile is not None:
+                self._git_catfile.close()
+        except Exception:
+            pass
+        super().closeEvent(e)
+
 # ---------- Boot ---------------------------------------------------------------
 def ensure_catalog_root(start_dir: Path | None = None) -> Path:
     root = DEFAULT_CATALOG_DIR if start_dir is None else start_dir
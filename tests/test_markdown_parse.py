@@ -0,0 +1,52 @@
+import pytest
+
+pytest.importorskip("PyQt5")  # parts_catalog_tool imports PyQt5 at module level
+
+from parts_catalog_tool import CatalogWindow, _classify_lines, _LK_TABLE, _LK_DIVIDER
+
+# Hand-edited/imported files may indent table rows; they must still parse
+INDENTED_TABLES = """# Circuit Metadata
+
+## Introduction
+
+ | Field | Value |
+ | ----- | ----- |
+ | Title | Indented |
+ | Part Number | PN-7 |
+
+## Revision History
+
+  | Rev | Date | Description | By |
+  | --- | ---- | ----------- | -- |
+  | A | 2024-01-01 | First | JD |
+
+## Variant Details
+
+- V1
+"""
+
+
+def _parser():
+    # parse_markdown/build_markdown touch no Qt state: skip QMainWindow.__init__
+    return CatalogWindow.__new__(CatalogWindow)
+
+
+def test_classify_indented_table_rows():
+    kinds = _classify_lines([" | a | b |", "  | --- | --- |", "|x|"])
+    assert all(k & _LK_TABLE for k in kinds)
+    assert kinds[1] & _LK_DIVIDER and not kinds[0] & _LK_DIVIDER
+
+
+def test_parse_indented_tables():
+    fields, rev_rows, variant_items, *_ = _parser().parse_markdown(INDENTED_TABLES)
+    assert fields["Title"] == "Indented"
+    assert fields["Part Number"] == "PN-7"
+    assert rev_rows == [["A", "2024-01-01", "First", "JD"]]
+    assert variant_items == ["V1"]
+
+
+def test_indented_tables_survive_save():
+    w = _parser()
+    parsed = w.parse_markdown(INDENTED_TABLES)
+    reparsed = w.parse_markdown(w.build_markdown(*parsed))
+    assert reparsed[:3] == parsed[:3]